@@ -14,9 +14,7 @@ from fastapi_agent.core.session_manager import (
 )
 from fastapi_agent.skills import create_skill_tools
 from fastapi_agent.tools import BashTool, EditTool, ReadTool, Tool, WriteTool, SpawnAgentTool
-from fastapi_agent.tools.mcp_loader import cleanup_mcp_connections, load_mcp_tools_async
 from fastapi_agent.tools.note_tool import RecallNoteTool, SessionNoteTool
-from fastapi_agent.tools.rag_tool import RAGTool
 
 # Global MCP tools storage (loaded at startup)
 _mcp_tools: list[Tool] = []
@@ -83,6 +81,9 @@ async def initialize_mcp_tools() -> None:
         debug_log.write(msg + "\n")
         debug_log.flush()
 
+        # Deferred: the MCP SDK is only loaded when MCP is enabled
+        from fastapi_agent.tools.mcp_loader import load_mcp_tools_async
+
         mcp_tools = await load_mcp_tools_async(settings.MCP_CONFIG_PATH)
         _mcp_tools = mcp_tools
 
@@ -120,6 +121,8 @@ async def cleanup_mcp_tools() -> None:
     if not settings.ENABLE_MCP or not _mcp_tools:
         return
 
+    from fastapi_agent.tools.mcp_loader import cleanup_mcp_connections
+
     print("🧹 Cleaning up MCP connections...")
     await cleanup_mcp_connections()
     _mcp_tools = []
@@ -300,6 +303,9 @@ def get_tools(workspace_dir: str | None = None) -> list[Tool]:
 
     # Add RAG tool if enabled
     if settings.ENABLE_RAG:
+        # Deferred: the RAG stack (asyncpg, pgvector, embeddings) is only loaded when enabled
+        from fastapi_agent.tools.rag_tool import RAGTool
+
         tools.append(RAGTool())
 
     return tools
@@ -492,6 +498,8 @@ class AgentFactory:
         if enable_mcp:
             # Use custom MCP config if provided
             if config.mcp_config_path:
+                from fastapi_agent.tools.mcp_loader import load_mcp_tools_async
+
                 mcp_tools = await load_mcp_tools_async(config.mcp_config_path)
             else:
                 # Use global MCP tools
@@ -509,6 +517,8 @@ class AgentFactory:
         # RAG tool
         enable_rag = config.enable_rag if config.enable_rag is not None else self.settings.ENABLE_RAG
         if enable_rag:
+            from fastapi_agent.tools.rag_tool import RAGTool
+
             tools.append(RAGTool())
 
         return tools
@@ -1,11 +1,11 @@
 """Agent execution endpoints."""
 
-import json
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 
@@ -28,6 +28,11 @@ from fastapi_agent.schemas.message import AgentRequest, AgentResponse, AgentConf
 router = APIRouter()
 
 
+def _sse_json(payload: dict[str, Any]) -> str:
+    """Encode one SSE event payload (called once per streamed event)."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 @router.post("/run", response_model=AgentResponse)
 async def run_agent(
     request: AgentRequest,
@@ -260,7 +265,7 @@ async def run_agent_stream(
                     agent.messages.append(Message(role=msg["role"], content=msg["content"]))
 
                 # Send session info
-                yield f"data: {json.dumps({'type': 'session', 'data': {'session_id': request.session_id, 'run_id': run_id}}, ensure_ascii=False)}\n\n"
+                yield f"data: {_sse_json({'type': 'session', 'data': {'session_id': request.session_id, 'run_id': run_id}})}\n\n"
 
             # Add user message
             agent.add_user_message(request.message)
@@ -279,10 +284,10 @@ async def run_agent_stream(
                     content_buffer = event_data.get("message", content_buffer)
 
                 # Format as SSE
-                sse_data = json.dumps({
+                sse_data = _sse_json({
                     "type": event_type,
                     "data": event_data,
-                }, ensure_ascii=False)
+                })
 
                 yield f"data: {sse_data}\n\n"
 
@@ -317,7 +322,7 @@ async def run_agent_stream(
                 await session_manager.add_run(request.session_id, run_record)
 
             # Send error event
-            error_data = json.dumps({
+            error_data = _sse_json({
                 "type": "error",
                 "data": {"message": str(e)},
             })
@@ -16,6 +16,7 @@ from fastapi_agent.schemas.team import (
     TaskWithDependencies,
     DependencyRunRequest,
     DependencyRunResponse,
+    MEMBER_RUNS_ADAPTER,
 )
 from fastapi_agent.api.deps import get_llm_client, get_tools, get_session_manager
 from fastapi_agent.core.session_manager import UnifiedTeamSessionManager
@@ -203,7 +204,7 @@ async def run_team(
             success=result.success,
             team_name=result.team_name,
             message=result.message,
-            member_runs=[mr.model_dump() for mr in result.member_runs],
+            member_runs=MEMBER_RUNS_ADAPTER.dump_python(result.member_runs),
             total_steps=result.total_steps,
             iterations=result.iterations,
             metadata=result.metadata
@@ -2,7 +2,8 @@
 
 from fastapi import APIRouter
 
-from fastapi_agent.api.v1.endpoints import agent, health, knowledge, team, tools, trace
+from fastapi_agent.api.v1.endpoints import agent, health, team, tools, trace
+from fastapi_agent.core.config import settings
 
 api_router = APIRouter()
 
@@ -10,9 +11,14 @@ api_router = APIRouter()
 api_router.include_router(agent.router, prefix="/agent", tags=["agent"])
 api_router.include_router(team.router, tags=["team"])
 api_router.include_router(tools.router, prefix="/tools", tags=["tools"])
-api_router.include_router(knowledge.router, prefix="/knowledge", tags=["knowledge"])
 api_router.include_router(trace.router, prefix="/trace", tags=["trace"])
 
+# Knowledge base endpoints pull in the RAG stack; only load them when enabled
+if settings.ENABLE_RAG:
+    from fastapi_agent.api.v1.endpoints import knowledge
+
+    api_router.include_router(knowledge.router, prefix="/knowledge", tags=["knowledge"])
+
 # Health endpoint at root level (not versioned)
 health_router = APIRouter()
 health_router.include_router(health.router, tags=["health"])
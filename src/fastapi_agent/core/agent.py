@@ -2,7 +2,7 @@
 
 import time
 from pathlib import Path
-from typing import Any, AsyncIterator, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
 from fastapi_agent.core.agent_logger import AgentLogger
 from fastapi_agent.core.llm_client import LLMClient
@@ -11,7 +11,7 @@ from fastapi_agent.core.prompt_builder import (
     SystemPromptConfig,
     SystemPromptBuilder,
 )
-from fastapi_agent.schemas.message import Message
+from fastapi_agent.schemas.message import Message, ToolCall
 from fastapi_agent.skills.skill_loader import SkillLoader
 from fastapi_agent.tools.base import Tool, ToolResult
 
@@ -22,7 +22,7 @@ class Agent:
     def __init__(
         self,
         llm_client: LLMClient,
-        system_prompt: Optional[str] = None,
+        system_prompt: Optional[str | list[dict[str, Any]]] = None,
         prompt_config: Optional[SystemPromptConfig] = None,
         tools: list[Tool] | None = None,
         max_steps: int = 50,
@@ -34,12 +34,14 @@ class Agent:
         name: str | None = None,
         skill_loader: Optional[SkillLoader] = None,
         tool_output_limit: int = 10000,  # Maximum characters for tool output
+        prompt_cache_key: Optional[str] = None,
+        tokenizer: Any = None,
     ) -> None:
         """Initialize Agent.
 
         Args:
             llm_client: LLM client
-            system_prompt: 系统提示字符串(旧方式,向后兼容)
+            system_prompt: 系统提示字符串(旧方式,向后兼容)，或带 cache_control 的内容块列表
             prompt_config: 系统提示配置(新方式,推荐)
             tools: 工具列表
             max_steps: 最大执行步数
@@ -51,6 +53,8 @@ class Agent:
             name: Agent 名称
             skill_loader: Skill 加载器(用于注入 skills 元数据到系统提示)
             tool_output_limit: 工具输出最大字符数(防止Token爆炸)
+            prompt_cache_key: Prompt 缓存键(共享相同前缀的 Agent 复用 provider 缓存)
+            tokenizer: 预构建的 tiktoken 编码器(快速路径，默认使用进程共享实例)
         """
         self.llm = llm_client
         self.name = name  # Agent name for team coordination
@@ -59,12 +63,14 @@ class Agent:
         self.workspace_dir = Path(workspace_dir)
         self.skill_loader = skill_loader
         self.tool_output_limit = tool_output_limit
+        self.prompt_cache_key = prompt_cache_key
 
         # Initialize Token Manager
         self.token_manager = TokenManager(
             llm_client=llm_client,
             token_limit=token_limit,
             enable_summarization=enable_summarization,
+            encoding=tokenizer,
         )
 
         # Initialize Agent Logger
@@ -83,7 +89,12 @@ class Agent:
             self.system_prompt = self._build_structured_prompt(prompt_config)
         elif system_prompt:
             # 旧方式: 直接使用字符串(向后兼容)
-            if "Current Workspace" not in system_prompt and "workspace_info" not in system_prompt:
+            # 内容块列表原样使用，由调用方负责包含工作空间信息(追加文本会破坏缓存前缀)
+            if (
+                isinstance(system_prompt, str)
+                and "Current Workspace" not in system_prompt
+                and "workspace_info" not in system_prompt
+            ):
                 workspace_info = (
                     f"\n\n## Current Workspace\n"
                     f"You are currently working in: `{self.workspace_dir.absolute()}`\n"
@@ -137,6 +148,15 @@ class Agent:
         )
         return self._build_structured_prompt(config)
 
+    def reset_conversation(self) -> None:
+        """Clear message history and logs, keeping tools and system prompt.
+
+        Lets a configured agent be reused for a new, independent task.
+        """
+        self.messages = [Message(role="system", content=self.system_prompt)]
+        self.execution_logs = []
+        self.token_manager.core_memory = ""
+
     def add_user_message(self, content: str):
         """Add a user message to history."""
         self.messages.append(Message(role="user", content=content))
@@ -156,13 +176,87 @@ class Agent:
         truncated = content[:self.tool_output_limit]
         return f"{truncated}\n\n[... output truncated, {len(content) - self.tool_output_limit} more characters ...]"
 
-    async def run(self) -> tuple[str, list[dict[str, Any]]]:
+    async def _execute_tool(self, function_name: str, arguments: dict[str, Any]) -> ToolResult:
+        """Execute a single tool call, converting failures into a ToolResult."""
+        if function_name not in self.tools:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"Unknown tool: {function_name}",
+            )
+        try:
+            return await self.tools[function_name].execute(**arguments)
+        except Exception as e:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"Tool execution failed: {str(e)}",
+            )
+
+    async def _run_spawn_batch(
+        self, tool_calls: list[ToolCall], start: int
+    ) -> dict[str, tuple[ToolResult, float]]:
+        """Run the consecutive spawn_agent calls starting at ``start`` concurrently.
+
+        Sub-agents are independent of each other, so a run of adjacent
+        spawn_agent calls is dispatched together through
+        ``SpawnAgentTool.execute_many_timed`` when the tool loop reaches it.
+        Only adjacent calls are batched: a spawn listed after another tool
+        call may depend on that call's effects, so it keeps its position.
+
+        Args:
+            tool_calls: Tool calls from the current LLM response
+            start: Index of the first spawn_agent call of the run
+
+        Returns:
+            Mapping of tool_call id to (result, execution_time); empty when
+            the run has a single call and should execute normally
+        """
+        spawn_tool = self.tools.get("spawn_agent")
+        end = start
+        while end < len(tool_calls) and tool_calls[end].function.name == "spawn_agent":
+            end += 1
+        spawn_calls = tool_calls[start:end]
+        if len(spawn_calls) < 2 or not hasattr(spawn_tool, "execute_many_timed"):
+            return {}
+
+        timed_results = await spawn_tool.execute_many_timed(
+            [tc.function.arguments for tc in spawn_calls]
+        )
+        return {tc.id: timed for tc, timed in zip(spawn_calls, timed_results)}
+
+    async def run(
+        self,
+        log_sink: Optional[Callable[[dict[str, Any]], None]] = None,
+        stop_condition: Optional[Callable[[dict[str, Any]], bool]] = None,
+    ) -> tuple[str, list[dict[str, Any]]]:
         """Execute agent loop until task is complete or max steps reached.
 
+        Args:
+            log_sink: Optional callable receiving each execution log entry.
+                When given, entries are not accumulated, and the returned
+                log list stays empty, so callers that only need aggregates
+                do not hold the whole trace in memory.
+            stop_condition: Optional predicate over execution log entries.
+                Once it matches, the run stops after the current step's tool
+                calls finish (keeping the message history consistent) instead
+                of making further LLM calls.
+
         Returns:
             Tuple of (final_response, execution_logs)
         """
         self.execution_logs = []
+        emit_log = log_sink or self.execution_logs.append
+        stop_requested = False
+        if stop_condition is not None:
+            sink = emit_log
+
+            def emit_log(entry: dict[str, Any]) -> None:
+                nonlocal stop_requested
+                sink(entry)
+                if not stop_requested and stop_condition(entry):
+                    stop_requested = True
+
         step = 0
         total_input_tokens = 0
         total_output_tokens = 0
@@ -179,7 +273,7 @@ class Agent:
             self.messages = await self.token_manager.maybe_summarize_messages(self.messages)
 
             # Log step and token usage
-            self.execution_logs.append({
+            emit_log({
                 "type": "step",
                 "step": step,
                 "max_steps": self.max_steps,
@@ -210,11 +304,12 @@ class Agent:
             try:
                 response = await self.llm.generate(
                     messages=self.messages,
-                    tools=tool_schemas
+                    tools=tool_schemas,
+                    prompt_cache_key=self.prompt_cache_key,
                 )
             except Exception as e:
                 error_msg = f"LLM call failed: {str(e)}"
-                self.execution_logs.append({
+                emit_log({
                     "type": "error",
                     "message": error_msg
                 })
@@ -238,8 +333,9 @@ class Agent:
                 "tool_count": len(response.tool_calls) if response.tool_calls else 0,
                 "input_tokens": response.usage.input_tokens if response.usage else 0,
                 "output_tokens": response.usage.output_tokens if response.usage else 0,
+                "cached_tokens": response.usage.cache_read_input_tokens if response.usage else 0,
             }
-            self.execution_logs.append(log_entry)
+            emit_log(log_entry)
 
             if self.logger:
                 self.logger.log_response(
@@ -260,7 +356,7 @@ class Agent:
             self.messages.append(assistant_msg)
 
             if not response.tool_calls:
-                self.execution_logs.append({
+                emit_log({
                     "type": "completion",
                     "message": "Task completed successfully",
                     "total_input_tokens": total_input_tokens,
@@ -275,41 +371,35 @@ class Agent:
                     )
                 return response.content, self.execution_logs
 
+            # Results of adjacent spawn_agent calls that were run as one batch
+            spawn_results: dict[str, tuple[ToolResult, float]] = {}
+
             # Execute tool calls
-            for tool_call in response.tool_calls:
+            for index, tool_call in enumerate(response.tool_calls):
                 tool_call_id = tool_call.id
                 function_name = tool_call.function.name
                 arguments = tool_call.function.arguments
 
                 # Log tool call
-                self.execution_logs.append({
+                emit_log({
                     "type": "tool_call",
+                    "step": step,
                     "tool": function_name,
                     "arguments": arguments,
                 })
 
                 # Execute tool and measure execution time
-                start_time = time.time()
-                if function_name not in self.tools:
-                    result = ToolResult(
-                        success=False,
-                        content="",
-                        error=f"Unknown tool: {function_name}",
-                    )
+                if function_name == "spawn_agent" and tool_call_id not in spawn_results:
+                    spawn_results = await self._run_spawn_batch(response.tool_calls, index)
+                if tool_call_id in spawn_results:
+                    result, execution_time = spawn_results[tool_call_id]
                 else:
-                    try:
-                        tool = self.tools[function_name]
-                        result = await tool.execute(**arguments)
-                    except Exception as e:
-                        result = ToolResult(
-                            success=False,
-                            content="",
-                            error=f"Tool execution failed: {str(e)}",
-                        )
-                execution_time = time.time() - start_time
+                    start_time = time.time()
+                    result = await self._execute_tool(function_name, arguments)
+                    execution_time = time.time() - start_time
 
                 # Log tool result
-                self.execution_logs.append({
+                emit_log({
                     "type": "tool_result",
                     "tool": function_name,
                     "success": result.success,
@@ -341,8 +431,25 @@ class Agent:
                 )
                 self.messages.append(tool_msg)
 
+            if stop_requested:
+                stop_msg = f"Run stopped by stop condition at step {step}."
+                emit_log({
+                    "type": "stopped",
+                    "message": stop_msg,
+                    "total_input_tokens": total_input_tokens,
+                    "total_output_tokens": total_output_tokens,
+                    "total_tokens": total_input_tokens + total_output_tokens,
+                })
+                if self.logger:
+                    self.logger.log_completion(
+                        final_response=stop_msg,
+                        total_steps=step,
+                        reason="stopped",
+                    )
+                return stop_msg, self.execution_logs
+
         error_msg = f"Task couldn't be completed after {self.max_steps} steps."
-        self.execution_logs.append({
+        emit_log({
             "type": "max_steps_reached",
             "message": error_msg,
             "total_input_tokens": total_input_tokens,
@@ -416,7 +523,8 @@ class Agent:
             try:
                 async for event in self.llm.generate_stream(
                     messages=self.messages,
-                    tools=tool_schemas
+                    tools=tool_schemas,
+                    prompt_cache_key=self.prompt_cache_key,
                 ):
                     event_type = event.get("type")
 
@@ -493,31 +601,24 @@ class Agent:
                 }
                 return
 
+            # Results of adjacent spawn_agent calls that were run as one batch
+            spawn_results: dict[str, tuple[ToolResult, float]] = {}
+
             # Execute tools
-            for tool_call in tool_calls_buffer:
+            for index, tool_call in enumerate(tool_calls_buffer):
                 tool_call_id = tool_call.id
                 function_name = tool_call.function.name
                 arguments = tool_call.function.arguments
 
                 # Execute tool and measure time
-                start_time = time.time()
-                if function_name not in self.tools:
-                    result = ToolResult(
-                        success=False,
-                        content="",
-                        error=f"Unknown tool: {function_name}",
-                    )
+                if function_name == "spawn_agent" and tool_call_id not in spawn_results:
+                    spawn_results = await self._run_spawn_batch(tool_calls_buffer, index)
+                if tool_call_id in spawn_results:
+                    result, execution_time = spawn_results[tool_call_id]
                 else:
-                    try:
-                        tool = self.tools[function_name]
-                        result = await tool.execute(**arguments)
-                    except Exception as e:
-                        result = ToolResult(
-                            success=False,
-                            content="",
-                            error=f"Tool execution failed: {str(e)}",
-                        )
-                execution_time = time.time() - start_time
+                    start_time = time.time()
+                    result = await self._execute_tool(function_name, arguments)
+                    execution_time = time.time() - start_time
 
                 # Yield tool result
                 yield {
@@ -1,11 +1,12 @@
 """Agent run logger with structured logging and pluggable storage."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
+
 from fastapi_agent.core.config import settings
 from fastapi_agent.core.run_log_storage import RunLogStorage, get_run_log_storage
 from fastapi_agent.schemas.message import Message, ToolCall
@@ -13,6 +14,11 @@ from fastapi_agent.schemas.message import Message, ToolCall
 logger = logging.getLogger(__name__)
 
 
+def _dumps(value: Any) -> str:
+    """Serialize a console log payload (orjson keeps non-ASCII text readable)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class AgentLogger:
     """Agent run logger with async storage backend support.
 
@@ -29,8 +35,17 @@ class AgentLogger:
             self._storage = await get_run_log_storage()
         return self._storage
 
+    @property
+    def enabled(self) -> bool:
+        """Whether events are written anywhere (console at INFO or run log storage).
+
+        Callers can check this before building expensive event payloads.
+        """
+        return settings.ENABLE_DEBUG_LOGGING or logger.isEnabledFor(logging.INFO)
+
     def _save_event_sync(self, event: dict) -> None:
-        self._log_to_console(event)
+        if logger.isEnabledFor(logging.INFO):
+            self._log_to_console(event)
         if settings.ENABLE_DEBUG_LOGGING:
             try:
                 loop = asyncio.get_running_loop()
@@ -62,7 +77,7 @@ class AgentLogger:
 
             logger.info(f"\n{'-'*80}")
             logger.info(f"[REQUEST] messages={len(messages)} tools={len(tools)} tokens={token_count:,}")
-            logger.info(f"[REQUEST] tools: {json.dumps(tools, ensure_ascii=False)}")
+            logger.info(f"[REQUEST] tools: {_dumps(tools)}")
 
             for i, msg in enumerate(messages):
                 role = msg.get("role", "unknown")
@@ -71,21 +86,21 @@ class AgentLogger:
 
                 if role == "system":
                     preview = content[:800] + "..." if len(content) > 800 else content
-                    logger.info(f"[REQUEST] msg[{i}] role=system content={json.dumps(preview, ensure_ascii=False)}")
+                    logger.info(f"[REQUEST] msg[{i}] role=system content={_dumps(preview)}")
                 elif role == "user":
-                    logger.info(f"[REQUEST] msg[{i}] role=user content={json.dumps(content, ensure_ascii=False)}")
+                    logger.info(f"[REQUEST] msg[{i}] role=user content={_dumps(content)}")
                 elif role == "assistant":
                     if tool_calls:
-                        logger.info(f"[REQUEST] msg[{i}] role=assistant tool_calls={json.dumps(tool_calls, ensure_ascii=False)}")
+                        logger.info(f"[REQUEST] msg[{i}] role=assistant tool_calls={_dumps(tool_calls)}")
                     if content:
                         preview = content[:300] + "..." if len(content) > 300 else content
-                        logger.info(f"[REQUEST] msg[{i}] role=assistant content={json.dumps(preview, ensure_ascii=False)}")
+                        logger.info(f"[REQUEST] msg[{i}] role=assistant content={_dumps(preview)}")
                 elif role == "tool":
                     tool_name = msg.get("name", "unknown")
                     tool_call_id = msg.get("tool_call_id", "")
                     preview = content[:500] + "..." if len(content) > 500 else content
                     logger.info(f"[REQUEST] msg[{i}] role=tool name={tool_name} tool_call_id={tool_call_id}")
-                    logger.info(f"[REQUEST] msg[{i}] content={json.dumps(preview, ensure_ascii=False)}")
+                    logger.info(f"[REQUEST] msg[{i}] content={_dumps(preview)}")
 
         elif event_type == "RESPONSE":
             content = data.get("content", "")
@@ -100,14 +115,14 @@ class AgentLogger:
 
             if thinking:
                 preview = thinking[:500] + "..." if len(thinking) > 500 else thinking
-                logger.info(f"[RESPONSE] thinking={json.dumps(preview, ensure_ascii=False)}")
+                logger.info(f"[RESPONSE] thinking={_dumps(preview)}")
 
             if tool_calls:
-                logger.info(f"[RESPONSE] tool_calls={json.dumps(tool_calls, ensure_ascii=False)}")
+                logger.info(f"[RESPONSE] tool_calls={_dumps(tool_calls)}")
 
             if content:
                 preview = content[:800] + "..." if len(content) > 800 else content
-                logger.info(f"[RESPONSE] content={json.dumps(preview, ensure_ascii=False)}")
+                logger.info(f"[RESPONSE] content={_dumps(preview)}")
 
         elif event_type == "TOOL_EXECUTION":
             tool_name = data.get("tool_name", "unknown")
@@ -120,13 +135,13 @@ class AgentLogger:
 
             logger.info(f"\n{'-'*80}")
             logger.info(f"[TOOL_EXECUTION] tool={tool_name} success={success} time={exec_time:.3f}s result_length={result_len}")
-            logger.info(f"[TOOL_EXECUTION] arguments={json.dumps(arguments, ensure_ascii=False)}")
+            logger.info(f"[TOOL_EXECUTION] arguments={_dumps(arguments)}")
 
             if success and result:
                 preview = result[:1000] + "..." if len(result) > 1000 else result
-                logger.info(f"[TOOL_EXECUTION] result={json.dumps(preview, ensure_ascii=False)}")
+                logger.info(f"[TOOL_EXECUTION] result={_dumps(preview)}")
             elif error:
-                logger.info(f"[TOOL_EXECUTION] error={json.dumps(error, ensure_ascii=False)}")
+                logger.info(f"[TOOL_EXECUTION] error={_dumps(error)}")
 
         elif event_type == "COMPLETION":
             steps = data.get("total_steps", 0)
@@ -137,7 +152,7 @@ class AgentLogger:
             logger.info(f"[COMPLETION] total_steps={steps} reason={reason}")
             if final_response:
                 preview = final_response[:500] + "..." if len(final_response) > 500 else final_response
-                logger.info(f"[COMPLETION] final_response={json.dumps(preview, ensure_ascii=False)}")
+                logger.info(f"[COMPLETION] final_response={_dumps(preview)}")
             logger.info(f"{'='*80}\n")
 
     async def _save_event_async(self, event: dict) -> None:
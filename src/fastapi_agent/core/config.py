@@ -1,7 +1,7 @@
 """Application configuration using pydantic-settings."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,6 +28,10 @@ class Settings(BaseSettings):
     ALLOWED_ORIGINS: list[str] = Field(
         default_factory=lambda: ["*"]
     )
+    ALLOWED_HOSTS: list[str] = Field(
+        default_factory=lambda: ["localhost", "127.0.0.1", "*.example.com"],
+        description="Hosts accepted by TrustedHostMiddleware (only enforced when DEBUG is off)"
+    )
 
     # LLM settings (supports 100+ providers via LiteLLM)
     # Model naming: "provider/model" e.g. "openai/gpt-4o", "anthropic/claude-3-5-sonnet-20241022"
@@ -128,6 +132,10 @@ class Settings(BaseSettings):
     )
 
     # Run log settings
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+        default="INFO",
+        description="Console log level for the fastapi_agent logger (WARNING skips per-step INFO logs)"
+    )
     ENABLE_DEBUG_LOGGING: bool = Field(
         default=False,
         description="Enable debug logging to files (when False, only console output)"
@@ -286,10 +294,18 @@ class Settings(BaseSettings):
         path.mkdir(parents=True, exist_ok=True)
         return str(path.absolute())
 
-    @field_validator("ALLOWED_ORIGINS", mode="before")
+    @field_validator("LOG_LEVEL", mode="before")
+    @classmethod
+    def normalize_log_level(cls, v: Any) -> Any:
+        """Accept log level names in any case."""
+        if isinstance(v, str):
+            return v.strip().upper()
+        return v
+
+    @field_validator("ALLOWED_ORIGINS", "ALLOWED_HOSTS", mode="before")
     @classmethod
     def parse_cors_origins(cls, v: Any) -> list[str]:
-        """Parse CORS origins from string or list."""
+        """Parse CORS origins / allowed hosts from string or list."""
         if isinstance(v, str):
             return [origin.strip() for origin in v.split(",")]
         return v
@@ -102,7 +102,9 @@ class LLMClient:
             return limit
         return requested
 
-    def _convert_messages(self, messages: list[Message]) -> tuple[str | None, list[dict[str, Any]]]:
+    def _convert_messages(
+        self, messages: list[Message]
+    ) -> tuple[str | list[dict[str, Any]] | None, list[dict[str, Any]]]:
         """Convert internal message format to OpenAI format.
 
         Returns:
@@ -151,6 +153,24 @@ class LLMClient:
 
         return system_message, api_messages
 
+    def _system_api_message(self, system: str | list[dict[str, Any]]) -> dict[str, Any]:
+        """Build the system message, marking a plain-text prompt as cacheable.
+
+        Anthropic only caches prefixes that carry an explicit cache_control
+        breakpoint; other providers cache identical prefixes automatically, so
+        their system prompt is sent unchanged. Prompts already given as content
+        blocks keep their own breakpoints.
+        """
+        if isinstance(system, str) and self._supports_cache_control:
+            system = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        return {"role": "system", "content": system}
+
+    @property
+    def _supports_cache_control(self) -> bool:
+        """Whether the model needs explicit cache_control breakpoints (Anthropic)."""
+        model_lower = self.model.lower()
+        return "anthropic" in model_lower or "claude" in model_lower
+
     def _convert_tools(self, tools: list[dict[str, Any]] | None) -> list[dict[str, Any]] | None:
         """Convert tools to OpenAI format if needed."""
         if not tools:
@@ -174,13 +194,14 @@ class LLMClient:
     async def _make_api_request(
         self,
         messages: list[dict[str, Any]],
-        system: str | None,
+        system: str | list[dict[str, Any]] | None,
         tools: list[dict[str, Any]] | None,
         max_tokens: int,
+        prompt_cache_key: str | None = None,
     ) -> Any:
         """Execute API request via litellm."""
         if system:
-            messages = [{"role": "system", "content": system}] + messages
+            messages = [self._system_api_message(system)] + messages
 
         kwargs: dict[str, Any] = {
             "model": self.model,
@@ -198,6 +219,10 @@ class LLMClient:
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
 
+        # Unsupported providers drop it (litellm.drop_params)
+        if prompt_cache_key:
+            kwargs["prompt_cache_key"] = prompt_cache_key
+
         response = await acompletion(**kwargs)
         return response
 
@@ -206,8 +231,17 @@ class LLMClient:
         messages: list[Message],
         tools: list[dict[str, Any]] | None = None,
         max_tokens: int = 16384,
+        prompt_cache_key: str | None = None,
     ) -> LLMResponse:
-        """Generate response from LLM."""
+        """Generate response from LLM.
+
+        Args:
+            messages: Conversation history
+            tools: Tool schemas available to the model
+            max_tokens: Requested max output tokens (clamped to provider limit)
+            prompt_cache_key: Optional key that routes requests sharing a prompt
+                prefix to the same provider cache (OpenAI-family models only)
+        """
         # Adjust max_tokens to respect provider limits
         max_tokens = self._adjust_max_tokens(max_tokens)
 
@@ -219,9 +253,13 @@ class LLMClient:
                 config=self.retry_config, on_retry=self.retry_callback
             )
             api_call = retry_decorator(self._make_api_request)
-            response = await api_call(api_messages, system_message, openai_tools, max_tokens)
+            response = await api_call(
+                api_messages, system_message, openai_tools, max_tokens, prompt_cache_key
+            )
         else:
-            response = await self._make_api_request(api_messages, system_message, openai_tools, max_tokens)
+            response = await self._make_api_request(
+                api_messages, system_message, openai_tools, max_tokens, prompt_cache_key
+            )
 
         choice = response.choices[0]
         message = choice.message
@@ -250,11 +288,12 @@ class LLMClient:
                 )
 
         usage_data = response.usage
+        prompt_details = getattr(usage_data, "prompt_tokens_details", None)
         usage = TokenUsage(
             input_tokens=getattr(usage_data, "prompt_tokens", 0),
             output_tokens=getattr(usage_data, "completion_tokens", 0),
-            cache_creation_input_tokens=0,
-            cache_read_input_tokens=0,
+            cache_creation_input_tokens=getattr(usage_data, "cache_creation_input_tokens", 0) or 0,
+            cache_read_input_tokens=getattr(prompt_details, "cached_tokens", 0) or 0,
         )
 
         return LLMResponse(
@@ -270,6 +309,7 @@ class LLMClient:
         messages: list[Message],
         tools: list[dict[str, Any]] | None = None,
         max_tokens: int = 16384,
+        prompt_cache_key: str | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
         """Generate streaming response from LLM."""
         # Adjust max_tokens to respect provider limits
@@ -279,7 +319,7 @@ class LLMClient:
         openai_tools = self._convert_tools(tools)
 
         if system_message:
-            api_messages = [{"role": "system", "content": system_message}] + api_messages
+            api_messages = [self._system_api_message(system_message)] + api_messages
 
         kwargs: dict[str, Any] = {
             "model": self.model,
@@ -298,6 +338,10 @@ class LLMClient:
             kwargs["tools"] = openai_tools
             kwargs["tool_choice"] = "auto"
 
+        # Unsupported providers drop it (litellm.drop_params)
+        if prompt_cache_key:
+            kwargs["prompt_cache_key"] = prompt_cache_key
+
         response = await acompletion(**kwargs)
 
         text_content = ""
@@ -5,13 +5,14 @@ Supports:
 - RedisStorage: Redis storage for cloud debugging
 """
 
-import json
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 from fastapi_agent.core.config import settings
 
 
@@ -84,18 +85,18 @@ class FileRunLogStorage(RunLogStorage):
     async def save_event(self, run_id: str, event: dict) -> None:
         event["run_id"] = run_id
         event["logged_at"] = datetime.now().isoformat()
-        with open(self._get_run_file(run_id), "a", encoding="utf-8") as f:
-            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        with open(self._get_run_file(run_id), "ab") as f:
+            f.write(orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
 
     async def get_events(self, run_id: str) -> list[dict]:
         run_file = self._get_run_file(run_id)
         if not run_file.exists():
             return []
         events = []
-        with open(run_file, "r", encoding="utf-8") as f:
+        with open(run_file, "rb") as f:
             for line in f:
                 if line.strip():
-                    events.append(json.loads(line))
+                    events.append(orjson.loads(line))
         return events
 
     async def list_runs(self, limit: int = 50) -> list[dict]:
@@ -185,7 +186,7 @@ class RedisRunLogStorage(RunLogStorage):
         event["logged_at"] = datetime.now().isoformat()
 
         key = self._run_key(run_id)
-        await r.rpush(key, json.dumps(event, ensure_ascii=False))
+        await r.rpush(key, orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS))
         await r.expire(key, self.ttl)
 
         await r.zadd(self._index_key(), {run_id: time.time()})
@@ -194,7 +195,7 @@ class RedisRunLogStorage(RunLogStorage):
         r = await self._get_redis()
         key = self._run_key(run_id)
         raw_events = await r.lrange(key, 0, -1)
-        return [json.loads(e) for e in raw_events]
+        return [orjson.loads(e) for e in raw_events]
 
     async def list_runs(self, limit: int = 50) -> list[dict]:
         r = await self._get_redis()
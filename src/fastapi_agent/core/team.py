@@ -17,12 +17,45 @@ from fastapi_agent.schemas.team import (
     TeamRunResponse,
     TaskWithDependencies,
     DependencyRunResponse,
+    TASKS_ADAPTER,
 )
 from fastapi_agent.tools.base import Tool
 from fastapi_agent.tools.function_tool import create_tool_from_function
 from fastapi_agent.tools.spawn_agent_tool import SpawnAgentTool
 
 
+class _RunSummary:
+    """Log sink that records an agent run's logs and summarizes them as they arrive.
+
+    Passed to ``Agent.run(log_sink=...)`` so the step count, max-steps flag and
+    token totals are collected in one pass instead of rescanning the log list.
+    """
+
+    __slots__ = ("logs", "steps", "max_steps_reached", "input_tokens", "output_tokens", "_finished")
+
+    def __init__(self) -> None:
+        self.logs: List[Dict[str, Any]] = []
+        self.steps = 0
+        self.max_steps_reached = False
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self._finished = False
+
+    def __call__(self, log: Dict[str, Any]) -> None:
+        self.logs.append(log)
+        log_type = log.get("type")
+        if log_type == "step":
+            self.steps += 1
+        elif log_type in ("completion", "max_steps_reached"):
+            if log_type == "max_steps_reached":
+                self.max_steps_reached = True
+            # Token totals come from the first terminal entry
+            if not self._finished:
+                self._finished = True
+                self.input_tokens = log.get("total_input_tokens", 0)
+                self.output_tokens = log.get("total_output_tokens", 0)
+
+
 class Team:
     """Team of agents that can collaborate on tasks."""
 
@@ -215,20 +248,16 @@ Focus on your area of expertise and provide clear, actionable responses.
             )
 
             member_agent.add_user_message(task)
-            response_content, logs = await member_agent.run()
+            summary = _RunSummary()
+            response_content, _ = await member_agent.run(log_sink=summary)
+            logs = summary.logs
 
-            steps = len([log for log in logs if log.get("type") == "step"])
-            max_steps_reached = any(log.get("type") == "max_steps_reached" for log in logs)
+            steps = summary.steps
             llm_failed = response_content and response_content.startswith("LLM call failed")
-            success = bool(response_content) and not max_steps_reached and not llm_failed
-
-            input_tokens = 0
-            output_tokens = 0
-            for log in logs:
-                if log.get("type") in ("completion", "max_steps_reached"):
-                    input_tokens = log.get("total_input_tokens", 0)
-                    output_tokens = log.get("total_output_tokens", 0)
-                    break
+            success = bool(response_content) and not summary.max_steps_reached and not llm_failed
+
+            input_tokens = summary.input_tokens
+            output_tokens = summary.output_tokens
 
             result = MemberRunResult(
                 member_name=member_config.name,
@@ -463,24 +492,20 @@ Focus on your area of expertise and provide clear, actionable responses.
 
             # Add task message and run the leader
             leader.add_user_message(message)
-            response_content, logs = await leader.run()
+            summary = _RunSummary()
+            response_content, _ = await leader.run(log_sink=summary)
+            logs = summary.logs
 
-            leader_steps = len([log for log in logs if log.get("type") == "step"])
+            leader_steps = summary.steps
             total_steps = leader_steps
             for member_run in self.member_runs:
                 total_steps += member_run.steps
 
-            leader_input_tokens = 0
-            leader_output_tokens = 0
-            for log in logs:
-                if log.get("type") in ("completion", "max_steps_reached"):
-                    leader_input_tokens = log.get("total_input_tokens", 0)
-                    leader_output_tokens = log.get("total_output_tokens", 0)
-                    break
+            leader_input_tokens = summary.input_tokens
+            leader_output_tokens = summary.output_tokens
 
-            max_steps_reached = any(log.get("type") == "max_steps_reached" for log in logs)
             llm_failed = response_content and response_content.startswith("LLM call failed")
-            success = bool(response_content) and not max_steps_reached and not llm_failed
+            success = bool(response_content) and not summary.max_steps_reached and not llm_failed
 
             if run_context.session_id:
                 leader_run_record = RunRecord(
@@ -550,8 +575,9 @@ Focus on your area of expertise and provide clear, actionable responses.
                 metadata={"error": str(e), "run_id": self._current_run_id, "trace_id": trace.trace_id}
             )
 
+    @staticmethod
     def _resolve_dependencies(
-        self, tasks: List[TaskWithDependencies]
+        tasks: List[TaskWithDependencies]
     ) -> List[List[TaskWithDependencies]]:
         """Resolve task dependencies using topological sort.
 
@@ -806,7 +832,7 @@ Focus on your area of expertise and provide clear, actionable responses.
             steps=total_steps,
             timestamp=time.time(),
             metadata={
-                "tasks": [task.model_dump() for task in tasks],
+                "tasks": TASKS_ADAPTER.dump_python(tasks),
                 "task_count": len(tasks),
             },
         )
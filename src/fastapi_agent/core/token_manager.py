@@ -1,5 +1,6 @@
 """Token management for message history with automatic summarization."""
 
+from functools import lru_cache
 from typing import Any
 
 import tiktoken
@@ -8,6 +9,19 @@ from fastapi_agent.core.llm_client import LLMClient
 from fastapi_agent.schemas.message import Message
 
 
+@lru_cache(maxsize=1)
+def get_shared_encoding() -> Any:
+    """Return the process-wide cl100k_base encoder, or None if tiktoken can't load it.
+
+    Loading the BPE tables is a multi-megabyte allocation, so every TokenManager
+    (including those of spawned sub-agents) shares a single instance.
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
 class TokenManager:
     """Manages token counting and message history summarization.
 
@@ -25,6 +39,7 @@ class TokenManager:
         token_limit: int = 120000,  # Default for claude-3-5-sonnet (200k context)
         enable_summarization: bool = True,
         summarize_after_rounds: int = 2,  # 超过 N 轮后触发压缩
+        encoding: Any = None,
     ):
         """Initialize Token Manager.
 
@@ -33,6 +48,7 @@ class TokenManager:
             token_limit: Maximum tokens before triggering summarization
             enable_summarization: Whether to enable automatic summarization
             summarize_after_rounds: Number of rounds after which to trigger compression
+            encoding: Pre-built tiktoken encoder (fast path); defaults to the shared one
         """
         self.llm = llm_client
         self.token_limit = token_limit
@@ -42,13 +58,9 @@ class TokenManager:
         # 核心记忆存储（跨轮次保持）
         self.core_memory: str = ""
 
-        # Initialize tiktoken encoder
-        try:
-            self.encoding = tiktoken.get_encoding("cl100k_base")
-            self.tiktoken_available = True
-        except Exception:
-            self.encoding = None
-            self.tiktoken_available = False
+        # Reuse the injected or process-wide tiktoken encoder
+        self.encoding = encoding if encoding is not None else get_shared_encoding()
+        self.tiktoken_available = self.encoding is not None
 
     def estimate_tokens(self, messages: list[Message]) -> int:
         """Accurately calculate token count for message history using tiktoken.
@@ -1,5 +1,6 @@
 """FastAPI application for Agent API with best practices architecture."""
 
+import sys
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -7,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 
 from fastapi_agent.api.deps import (
     cleanup_mcp_tools,
@@ -15,28 +17,37 @@ from fastapi_agent.api.deps import (
 )
 from fastapi_agent.api.v1.router import api_router, health_router
 from fastapi_agent.core.config import settings
-from fastapi_agent.rag.rag_service import rag_service
+from fastapi_agent.tools.note_tool import note_batcher
+
+
+def _write_banner(*lines: str) -> None:
+    """Write a block of startup/shutdown lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup and shutdown events."""
     # Startup
-    print("=" * 50)
-    print("FastAPI Agent Starting...")
-    print("=" * 50)
-    print(f"Project: {settings.PROJECT_NAME}")
-    print(f"Version: {settings.VERSION}")
-    print(f"Debug Mode: {settings.DEBUG}")
-    print(f"API Base: {settings.LLM_API_BASE}")
-    print(f"Model: {settings.LLM_MODEL}")
-    print(f"Max Steps: {settings.AGENT_MAX_STEPS}")
-    print(f"Workspace: {settings.AGENT_WORKSPACE_DIR}")
-    print(f"Skills Enabled: {settings.ENABLE_SKILLS}")
-    print(f"MCP Enabled: {settings.ENABLE_MCP}")
-    print(f"RAG Enabled: {settings.ENABLE_RAG}")
-    print(f"Session Enabled: {settings.ENABLE_SESSION}")
-    print("=" * 50)
+    separator = "=" * 50
+    _write_banner(
+        separator,
+        "FastAPI Agent Starting...",
+        separator,
+        f"Project: {settings.PROJECT_NAME}",
+        f"Version: {settings.VERSION}",
+        f"Debug Mode: {settings.DEBUG}",
+        f"API Base: {settings.LLM_API_BASE}",
+        f"Model: {settings.LLM_MODEL}",
+        f"Max Steps: {settings.AGENT_MAX_STEPS}",
+        f"Workspace: {settings.AGENT_WORKSPACE_DIR}",
+        f"Skills Enabled: {settings.ENABLE_SKILLS}",
+        f"MCP Enabled: {settings.ENABLE_MCP}",
+        f"RAG Enabled: {settings.ENABLE_RAG}",
+        f"Session Enabled: {settings.ENABLE_SESSION}",
+        separator,
+    )
 
     # Initialize MCP tools
     await initialize_mcp_tools()
@@ -44,35 +55,46 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize session manager
     await initialize_session_manager()
 
+    # Start batched note writer
+    note_batcher.start()
+
     # Initialize RAG service
+    # The RAG stack (asyncpg, pgvector, embeddings) is only imported when enabled
+    ready_lines: list[str] = []
     if settings.ENABLE_RAG:
+        from fastapi_agent.rag.rag_service import rag_service
+
         try:
             await rag_service.initialize()
-            print("✅ RAG Knowledge Base initialized")
+            ready_lines.append("✅ RAG Knowledge Base initialized")
         except Exception as e:
-            print(f"⚠️ RAG initialization failed: {e}")
-            print("   Knowledge base features will be unavailable")
+            ready_lines += [
+                f"⚠️ RAG initialization failed: {e}",
+                "   Knowledge base features will be unavailable",
+            ]
 
-    print("=" * 50)
-    print("✅ FastAPI Agent Ready!")
-    print("=" * 50)
+    _write_banner(*ready_lines, separator, "✅ FastAPI Agent Ready!", separator)
 
     yield
 
-    # Shutdown
-    print("=" * 50)
-    print("FastAPI Agent Shutting Down...")
-    print("=" * 50)
+    # Shutdown (the block is written once cleanup has finished)
+    shutdown_lines = [separator, "FastAPI Agent Shutting Down...", separator]
+
+    # Flush pending notes
+    await note_batcher.stop()
 
     # Cleanup MCP connections
     await cleanup_mcp_tools()
 
     # Cleanup RAG service
     if settings.ENABLE_RAG:
+        from fastapi_agent.rag.rag_service import rag_service
+
         await rag_service.shutdown()
-        print("✅ RAG service shutdown")
+        shutdown_lines.append("✅ RAG service shutdown")
 
-    print("✅ Shutdown complete")
+    shutdown_lines.append("✅ Shutdown complete")
+    _write_banner(*shutdown_lines)
 
 
 def create_application() -> FastAPI:
@@ -89,16 +111,19 @@ def create_application() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
+    # Middleware added last runs first: TrustedHost (cheapest reject) wraps
+    # GZip, which wraps CORS.
+
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=settings.ALLOWED_ORIGINS,
         allow_credentials=False,
-        allow_methods=["*"],
+        allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
         allow_headers=["*"],
-        expose_headers=["*"],
     )
 
     # Add GZip compression middleware
@@ -108,7 +133,7 @@ def create_application() -> FastAPI:
     if not settings.DEBUG:
         app.add_middleware(
             TrustedHostMiddleware,
-            allowed_hosts=["localhost", "127.0.0.1", "*.example.com"],
+            allowed_hosts=settings.ALLOWED_HOSTS,
         )
 
     # Include routers
@@ -1,17 +1,28 @@
 """Message and response schemas."""
 
-from typing import Any, Optional, List
-from pydantic import BaseModel, Field
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+# Explicit config for models built on every request / tool call: drop unknown
+# fields and skip re-validation on attribute assignment.
+_HOT_MODEL_CONFIG = ConfigDict(extra="ignore", validate_assignment=False)
+
+# Value objects that are never mutated after construction.
+_FROZEN_MODEL_CONFIG = ConfigDict(extra="ignore", validate_assignment=False, frozen=True)
 
 
 class FunctionCall(BaseModel):
     """Function call within a tool call."""
+    model_config = _FROZEN_MODEL_CONFIG
+
     name: str
     arguments: dict[str, Any]
 
 
 class ToolCall(BaseModel):
     """Tool call from LLM."""
+    model_config = _FROZEN_MODEL_CONFIG
+
     id: str
     type: str = "function"
     function: FunctionCall
@@ -19,21 +30,26 @@ class ToolCall(BaseModel):
 
 class Message(BaseModel):
     """Message in conversation history."""
+    model_config = _HOT_MODEL_CONFIG
+
     role: str  # system, user, assistant, tool
-    content: str | list[dict[str, Any]]
+    content: str | list[Any]  # multipart blocks are opaque dicts
     thinking: Optional[str] = None
-    tool_calls: Optional[List[ToolCall]] = None
+    tool_calls: Optional[list[ToolCall]] = None
     tool_call_id: Optional[str] = None
     name: Optional[str] = None
 
 
 class TokenUsage(BaseModel):
     """Token usage statistics."""
+    model_config = _FROZEN_MODEL_CONFIG
+
     input_tokens: int = 0
     output_tokens: int = 0
     cache_creation_input_tokens: int = 0
     cache_read_input_tokens: int = 0
 
+    @computed_field
     @property
     def total_tokens(self) -> int:
         return self.input_tokens + self.output_tokens
@@ -43,7 +59,7 @@ class LLMResponse(BaseModel):
     """Response from LLM."""
     content: str
     thinking: Optional[str] = None
-    tool_calls: Optional[List[ToolCall]] = None
+    tool_calls: Optional[list[ToolCall]] = None
     finish_reason: str = "stop"
     usage: Optional[TokenUsage] = None
 
@@ -63,11 +79,11 @@ class AgentConfig(BaseModel):
     enable_rag: Optional[bool] = Field(None, description="Enable RAG tool")
 
     # Custom tool lists
-    base_tools_filter: Optional[List[str]] = Field(
+    base_tools_filter: Optional[list[str]] = Field(
         None,
         description="Specific base tools to enable (e.g., ['read', 'write']). If None, all are enabled."
     )
-    mcp_tools_filter: Optional[List[str]] = Field(
+    mcp_tools_filter: Optional[list[str]] = Field(
         None,
         description="Specific MCP tools to enable by name. If None, all are enabled."
     )
@@ -90,6 +106,8 @@ class AgentConfig(BaseModel):
 
 class AgentRequest(BaseModel):
     """Request to agent endpoint."""
+    model_config = _HOT_MODEL_CONFIG
+
     message: str = Field(..., description="User message/task")
 
     # Team mode
@@ -123,9 +141,11 @@ class AgentRequest(BaseModel):
 
 class AgentResponse(BaseModel):
     """Response from agent endpoint."""
+    model_config = _HOT_MODEL_CONFIG
+
     success: bool
     message: str
     steps: int
-    logs: List[dict[str, Any]] = []
+    logs: list[dict[str, Any]] = []
     session_id: Optional[str] = Field(None, description="Session ID if session was used")
     run_id: Optional[str] = Field(None, description="Unique ID for this run")
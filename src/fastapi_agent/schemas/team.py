@@ -1,7 +1,7 @@
 """Team schemas for multi-agent collaboration."""
 
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, Optional
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class TeamMemberConfig(BaseModel):
@@ -11,7 +11,7 @@ class TeamMemberConfig(BaseModel):
     name: str = Field(..., description="Team member name")
     role: str = Field(..., description="Team member role/specialty")
     instructions: Optional[str] = Field(None, description="Specific instructions for this member")
-    tools: Optional[List[str]] = Field(default_factory=list, description="Tools available to this member")
+    tools: Optional[list[str]] = Field(default_factory=list, description="Tools available to this member")
     model: Optional[str] = Field(None, description="LLM model for this member (defaults to team model)")
 
 
@@ -20,7 +20,7 @@ class TeamConfig(BaseModel):
 
     name: str = Field(..., description="Team name")
     description: Optional[str] = Field(None, description="Team description")
-    members: List[TeamMemberConfig] = Field(..., description="Team members")
+    members: list[TeamMemberConfig] = Field(..., description="Team members")
     model: Optional[str] = Field("openai:gpt-4o-mini", description="Default model for the team")
     leader_instructions: Optional[str] = Field(
         None,
@@ -57,7 +57,7 @@ class MemberRunResult(BaseModel):
     success: bool
     error: Optional[str] = None
     steps: int = 0
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = Field(default_factory=dict)
 
 
 class TeamRunResponse(BaseModel):
@@ -66,10 +66,10 @@ class TeamRunResponse(BaseModel):
     success: bool
     team_name: str
     message: str
-    member_runs: List[MemberRunResult] = Field(default_factory=list)
+    member_runs: list[MemberRunResult] = Field(default_factory=list)
     total_steps: int = 0
     iterations: int = 0
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = Field(default_factory=dict)
 
 
 class TaskWithDependencies(BaseModel):
@@ -78,16 +78,16 @@ class TaskWithDependencies(BaseModel):
     id: str = Field(..., description="Unique task ID")
     task: str = Field(..., description="Task description")
     assigned_to: str = Field(..., description="Member role to assign this task to")
-    depends_on: List[str] = Field(default_factory=list, description="List of task IDs this task depends on")
+    depends_on: list[str] = Field(default_factory=list, description="List of task IDs this task depends on")
     status: str = Field("pending", description="Task status: pending, running, completed, failed")
     result: Optional[str] = Field(None, description="Task execution result")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional task metadata")
+    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional task metadata")
 
 
 class DependencyRunRequest(BaseModel):
     """Request to run team with dependency-based tasks."""
 
-    tasks: List[TaskWithDependencies] = Field(..., description="List of tasks with dependencies")
+    tasks: list[TaskWithDependencies] = Field(..., description="List of tasks with dependencies")
     team_config: Optional[TeamConfig] = Field(None, description="Team configuration (if creating new team)")
     team_id: Optional[str] = Field(None, description="Existing team ID to use")
     workspace_dir: Optional[str] = Field("./workspace", description="Workspace directory")
@@ -101,7 +101,12 @@ class DependencyRunResponse(BaseModel):
     success: bool
     team_name: str
     message: str
-    tasks: List[TaskWithDependencies] = Field(default_factory=list, description="Task execution results with status")
-    execution_order: List[List[str]] = Field(default_factory=list, description="Execution layers (for visualization)")
+    tasks: list[TaskWithDependencies] = Field(default_factory=list, description="Task execution results with status")
+    execution_order: list[list[str]] = Field(default_factory=list, description="Execution layers (for visualization)")
     total_steps: int = 0
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+
+# Module-level adapters so list (de)serialization reuses one compiled validator/serializer
+TASKS_ADAPTER = TypeAdapter(list[TaskWithDependencies])
+MEMBER_RUNS_ADAPTER = TypeAdapter(list[MemberRunResult])
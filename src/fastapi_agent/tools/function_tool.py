@@ -1,11 +1,24 @@
 """Function tool - dynamically create tools from callable functions."""
 
 import inspect
-from typing import Any, Callable, get_type_hints, Optional
+import types
+from typing import Any, Callable, Optional, Union, get_args, get_origin, get_type_hints
 
 from fastapi_agent.tools.base import Tool, ToolResult
 
 
+# Basic type mapping. Shared across calls: callers copy or nest these dicts
+# but never mutate them.
+_TYPE_MAP: dict[type, dict[str, Any]] = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    list: {"type": "array"},
+    dict: {"type": "object"},
+}
+
+
 def _extract_docstring(func: Callable) -> str:
     """Extract description from function docstring."""
     doc = inspect.getdoc(func)
@@ -21,7 +34,11 @@ def _generate_json_schema(func: Callable) -> dict[str, Any]:
     Simple implementation that handles basic types.
     """
     sig = inspect.signature(func)
-    type_hints = get_type_hints(func)
+    # Concrete annotations can be used as-is; only resolve forward references
+    # (string annotations) through the slower get_type_hints.
+    type_hints = getattr(func, '__annotations__', {})
+    if any(isinstance(hint, str) for hint in type_hints.values()):
+        type_hints = get_type_hints(func)
 
     properties = {}
     required = []
@@ -55,31 +72,21 @@ def _generate_json_schema(func: Callable) -> dict[str, Any]:
 
 def _type_to_json_schema(python_type: type) -> dict[str, Any]:
     """Convert Python type to JSON Schema type."""
-    # Handle Optional types
-    origin = getattr(python_type, '__origin__', None)
-    if origin is type(None) or str(python_type).startswith('typing.Optional'):
-        # Extract inner type from Optional[T]
-        args = getattr(python_type, '__args__', ())
-        if args:
+    # Handle Optional types: Optional[T] / Union[T, None] / T | None
+    origin = get_origin(python_type)
+    if origin is Union or origin is types.UnionType:
+        args = [a for a in get_args(python_type) if a is not type(None)]
+        if len(args) == 1:
             return _type_to_json_schema(args[0])
 
-    # Basic type mapping
-    type_map = {
-        str: {"type": "string"},
-        int: {"type": "integer"},
-        float: {"type": "number"},
-        bool: {"type": "boolean"},
-        list: {"type": "array"},
-        dict: {"type": "object"},
-    }
-
     # Check for exact match
-    if python_type in type_map:
-        return type_map[python_type]
+    schema = _TYPE_MAP.get(python_type)
+    if schema is not None:
+        return schema
 
     # Check for List[T]
     if origin is list:
-        args = getattr(python_type, '__args__', ())
+        args = get_args(python_type)
         if args:
             return {
                 "type": "array",
@@ -6,13 +6,112 @@
 - 跨 agent 执行链维护上下文
 """
 
-import json
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from fastapi_agent.tools.base import Tool, ToolResult
 
+# (秒级时间, 对应的 ISO 字符串)，同一秒内的笔记复用同一个格式化结果
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+class _NoteSnapshot:
+    """某一版本笔记文件的解析结果及其分类索引
+
+    写入笔记的工具与缓存共享同一个快照，追加笔记时原地扩展，开销只与新笔记有关。
+    """
+
+    __slots__ = ("signature", "notes", "_by_category")
+
+    def __init__(self, signature: tuple[int, int] | None, notes: list):
+        self.signature = signature
+        self.notes = notes
+        self._by_category: dict[str, list] | None = None
+
+    def by_category(self, category: str) -> list:
+        """返回指定分类的笔记，分类索引在首次按分类回忆时构建"""
+        if self._by_category is None:
+            index: dict[str, list] = defaultdict(list)
+            for note in self.notes:
+                index[note.get("category")].append(note)
+            self._by_category = dict(index)
+        return self._by_category.get(category, [])
+
+    def extend(self, signature: tuple[int, int], new_notes: list):
+        """追加已写入文件的新笔记，并更新分类索引和文件签名"""
+        self.notes.extend(new_notes)
+        if self._by_category is not None:
+            for note in new_notes:
+                self._by_category.setdefault(note.get("category"), []).append(note)
+        self.signature = signature
+
+
+# 笔记文件路径 -> 解析结果快照，以 (st_mtime_ns, st_size) 判断文件是否变化
+# 文件未变化时回忆笔记直接复用解析结果和分类索引，不再重复读取和解析；
+# 服务长期运行时每个会话工作区都有自己的笔记文件，只保留最近使用的若干个
+_NOTES_CACHE_SIZE = 32
+_notes_cache: "OrderedDict[str, _NoteSnapshot]" = OrderedDict()
+
+
+def _cache_snapshot(key: str, snapshot: _NoteSnapshot):
+    """放入缓存并标记为最近使用，超出容量时淘汰最久未使用的快照"""
+    _notes_cache[key] = snapshot
+    _notes_cache.move_to_end(key)
+    while len(_notes_cache) > _NOTES_CACHE_SIZE:
+        _notes_cache.popitem(last=False)
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    """返回用于判断文件是否变化的 (修改时间, 大小)"""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _parse_notes(data: bytes) -> list:
+    """解析笔记文件内容
+
+    笔记以 JSON Lines 格式存储（每行一条）；以 '[' 开头的旧版 JSON 数组格式同样支持。
+    """
+    if data.lstrip()[:1] == b"[":
+        return orjson.loads(data)
+    return [orjson.loads(line) for line in data.splitlines() if line.strip()]
+
+
+def _read_notes(path: Path) -> _NoteSnapshot:
+    """读取笔记文件，文件未变化时返回缓存的解析结果
+
+    文件不存在时抛出 FileNotFoundError。返回的快照为共享缓存，只有写入笔记的工具会扩展它，
+    其他调用方不应修改。
+    """
+    key = str(path)
+    signature = _file_signature(path)
+    cached = _notes_cache.get(key)
+    if cached is not None and cached.signature == signature:
+        _notes_cache.move_to_end(key)
+        return cached
+    snapshot = _NoteSnapshot(signature, _parse_notes(path.read_bytes()))
+    _cache_snapshot(key, snapshot)
+    return snapshot
+
+
+def _current_timestamp() -> str:
+    """返回秒级精度的 ISO 时间戳
+
+    批量记录笔记时同一秒内只格式化一次，避免每条笔记都构造 datetime 对象。
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
+
 
 class SessionNoteTool(Tool):
     """用于记录会话笔记的工具
@@ -36,6 +135,11 @@ class SessionNoteTool(Tool):
         """
         self.memory_file = Path(memory_file)
         # 延迟加载：文件和目录只在第一次记录笔记时创建
+        # 内存中的笔记快照，首次记录时从文件加载，之后写穿（write-through）到文件；
+        # 快照的签名与文件不一致说明有其他写入者
+        self._snapshot: _NoteSnapshot | None = None
+        # 文件为旧版 JSON 数组格式时，下次写入需整体重写为 JSON Lines
+        self._needs_rewrite = False
 
     @property
     def name(self) -> str:
@@ -66,31 +170,73 @@ class SessionNoteTool(Tool):
             "required": ["content"],
         }
 
-    def _load_from_file(self) -> list:
-        """从文件加载笔记
+    def _load_from_file(self) -> _NoteSnapshot:
+        """从文件加载笔记快照
 
-        如果文件不存在则返回空列表（延迟加载）
+        如果文件不存在则返回空快照（延迟加载）
         """
-        if not self.memory_file.exists():
-            return []
-
         try:
-            return json.loads(self.memory_file.read_text(encoding='utf-8'))
+            return _read_notes(self.memory_file)
+        except FileNotFoundError:
+            return _NoteSnapshot(None, [])
         except Exception:
-            return []
+            # 文件无法解析时从空笔记开始，记录当前签名以免每次写入都重新解析
+            return _NoteSnapshot(_file_signature(self.memory_file), [])
+
+    def _ensure_loaded(self) -> _NoteSnapshot:
+        """确保笔记快照已加载且与文件一致，返回该快照
+
+        同一笔记文件可能被多个工具实例写入（每个请求各自创建工具），
+        文件在上次同步后发生变化时重新加载。
+        """
+        try:
+            signature = _file_signature(self.memory_file)
+        except FileNotFoundError:
+            signature = None
+        if self._snapshot is None or signature != self._snapshot.signature:
+            self._snapshot = self._load_from_file()
+            try:
+                with self.memory_file.open("rb") as f:
+                    self._needs_rewrite = f.read(1) == b"["
+            except FileNotFoundError:
+                self._needs_rewrite = False
+        return self._snapshot
 
     def _save_to_file(self, notes: list):
-        """保存笔记到文件
+        """以 JSON Lines 格式重写整个笔记文件（用于迁移旧版 JSON 数组格式）
 
         如果父目录和文件不存在则创建（延迟初始化）
         """
         # 在实际保存时确保父目录存在
         self.memory_file.parent.mkdir(parents=True, exist_ok=True)
-        self.memory_file.write_text(
-            json.dumps(notes, indent=2, ensure_ascii=False),
-            encoding='utf-8'
+        self.memory_file.write_bytes(
+            b"".join(orjson.dumps(note, option=orjson.OPT_APPEND_NEWLINE) for note in notes)
         )
 
+    def _append_to_file(self, new_notes: list[dict[str, Any]]):
+        """把新笔记逐行追加到文件末尾，写入量只与新笔记有关
+
+        如果父目录和文件不存在则创建（延迟初始化）
+        """
+        self.memory_file.parent.mkdir(parents=True, exist_ok=True)
+        with self.memory_file.open("ab") as f:
+            f.write(b"".join(orjson.dumps(note, option=orjson.OPT_APPEND_NEWLINE) for note in new_notes))
+
+    def _append_notes(self, new_notes: list[dict[str, Any]]):
+        """追加一批笔记并写穿到文件
+
+        先写文件再扩展快照，写入失败时快照保持不变。
+        """
+        snapshot = self._ensure_loaded()
+        if self._needs_rewrite:
+            self._save_to_file(snapshot.notes + new_notes)
+            self._needs_rewrite = False
+        else:
+            self._append_to_file(new_notes)
+        # 写入前已与文件同步，扩展后的快照即为文件内容，放入缓存以免回忆时重新解析
+        snapshot.extend(_file_signature(self.memory_file), new_notes)
+        _cache_snapshot(str(self.memory_file), snapshot)
+
     async def execute(self, content: str, category: str = "general") -> ToolResult:
         """记录一条会话笔记
 
@@ -102,19 +248,18 @@ class SessionNoteTool(Tool):
             带有成功状态的 ToolResult
         """
         try:
-            # 加载现有笔记
-            notes = self._load_from_file()
-
             # 添加新笔记和时间戳
             note = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _current_timestamp(),
                 "category": category,
                 "content": content,
             }
-            notes.append(note)
 
-            # 保存回文件
-            self._save_to_file(notes)
+            # 批量写入器运行时合并并发写入，否则直接写入
+            if note_batcher.running:
+                await note_batcher.submit(self, note)
+            else:
+                self._append_notes([note])
 
             return ToolResult(
                 success=True,
@@ -128,6 +273,103 @@ class SessionNoteTool(Tool):
             )
 
 
+class NoteWriteBatcher:
+    """合并并发的 record_note 写入
+
+    多个 agent（例如 Team 成员或子 agent）在同一事件循环中并发记录笔记时，
+    每条笔记都会触发一次完整的文件写入。批量写入器把短时间窗口内的笔记
+    收集起来，对每个笔记工具只写一次文件。
+
+    由应用 lifespan 启动和停止；未启动时 SessionNoteTool 直接写入文件。
+    """
+
+    def __init__(self, max_batch_size: int = 64, max_queue_time: float = 0.01):
+        """初始化批量写入器
+
+        Args:
+            max_batch_size: 单批最多合并的笔记数
+            max_queue_time: 收到第一条笔记后等待更多笔记的最长时间（秒）
+        """
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """批量写入器是否正在运行"""
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """在当前事件循环中启动后台写入任务"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._drain())
+
+    async def stop(self):
+        """停止后台写入任务，并写入所有待处理的笔记"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def submit(self, tool: SessionNoteTool, note: dict[str, Any]):
+        """提交一条笔记，并等待它所在的批次写入完成"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((tool, note, future))
+        await future
+
+    async def _drain(self):
+        """后台任务：收集一批笔记后统一写入"""
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.max_queue_time
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+                self._flush(batch)
+                batch = []
+        finally:
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if batch:
+                self._flush(batch)
+
+    @staticmethod
+    def _flush(batch: list):
+        """按笔记工具分组写入，并通知等待中的调用方"""
+        grouped: dict[SessionNoteTool, list] = {}
+        for tool, note, future in batch:
+            grouped.setdefault(tool, []).append((note, future))
+
+        for tool, items in grouped.items():
+            try:
+                tool._append_notes([note for note, _ in items])
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in items:
+                    if not future.done():
+                        future.set_result(None)
+
+
+# 全局批量写入器实例（由应用 lifespan 启动）
+note_batcher = NoteWriteBatcher()
+
+
 class RecallNoteTool(Tool):
     """用于回忆已记录会话笔记的工具"""
 
@@ -173,23 +415,24 @@ class RecallNoteTool(Tool):
             带有笔记内容的 ToolResult
         """
         try:
-            if not self.memory_file.exists():
+            try:
+                snapshot = _read_notes(self.memory_file)
+            except FileNotFoundError:
                 return ToolResult(
                     success=True,
                     content="尚未记录任何笔记。",
                 )
 
-            notes = json.loads(self.memory_file.read_text(encoding='utf-8'))
-
+            notes = snapshot.notes
             if not notes:
                 return ToolResult(
                     success=True,
                     content="尚未记录任何笔记。",
                 )
 
-            # 如果指定了分类则过滤
+            # 如果指定了分类则通过分类索引过滤
             if category:
-                notes = [n for n in notes if n.get("category") == category]
+                notes = snapshot.by_category(category)
                 if not notes:
                     return ToolResult(
                         success=True,
@@ -197,16 +440,17 @@ class RecallNoteTool(Tool):
                     )
 
             # 格式化笔记用于显示
-            formatted = []
-            for idx, note in enumerate(notes, 1):
-                timestamp = note.get("timestamp", "未知时间")
-                cat = note.get("category", "general")
-                content = note.get("content", "")
-                formatted.append(
-                    f"{idx}. [{cat}] {content}\n   (记录于 {timestamp})"
+            formatted = "\n".join(
+                "%d. [%s] %s\n   (记录于 %s)" % (
+                    idx,
+                    note.get("category", "general"),
+                    note.get("content", ""),
+                    note.get("timestamp", "未知时间"),
                 )
+                for idx, note in enumerate(notes, 1)
+            )
 
-            result = "已记录的笔记:\n" + "\n".join(formatted)
+            result = "已记录的笔记:\n" + formatted
 
             return ToolResult(success=True, content=result)
 
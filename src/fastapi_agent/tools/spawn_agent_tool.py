@@ -1,9 +1,142 @@
 """SpawnAgentTool - Allows agents to dynamically create sub-agents for task delegation."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 from fastapi_agent.tools.base import Tool, ToolResult
 
+if TYPE_CHECKING:
+    from fastapi_agent.core.agent import Agent
+    from fastapi_agent.core.agent_logger import AgentLogger
+    from fastapi_agent.core.llm_client import LLMClient
+
+
+class AgentPool:
+    """Small LRU pool of idle sub-agents keyed by their configuration.
+
+    Spawning a sub-agent with the same configuration in a loop would otherwise
+    rebuild the Agent (tool map, token manager, tokenizer, logger) every time.
+    Checked-out agents are removed from the pool, so concurrent spawns with the
+    same key never share an instance. Agents are reset when returned, so idle
+    agents never hold on to a finished run's messages or logs.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        """Initialize AgentPool.
+
+        Args:
+            maxsize: Maximum number of idle agents kept
+        """
+        self.maxsize = maxsize
+        self._idle: "OrderedDict[Hashable, Agent]" = OrderedDict()
+
+    def checkout(self, key: Hashable, factory: Callable[[], "Agent"]) -> "Agent":
+        """Take an idle agent for ``key``, or build one.
+
+        Args:
+            key: Pool key describing the agent configuration
+            factory: Callable creating a new agent on a pool miss
+
+        Returns:
+            Agent ready for a new conversation
+        """
+        agent = self._idle.pop(key, None)
+        if agent is None:
+            return factory()
+        return agent
+
+    def return_(self, key: Hashable, agent: "Agent") -> None:
+        """Reset an agent and return it to the pool, evicting the least recently used one.
+
+        Args:
+            key: Pool key the agent was checked out with
+            agent: Agent to return
+        """
+        agent.reset_conversation()
+        self._idle[key] = agent
+        self._idle.move_to_end(key)
+        while len(self._idle) > self.maxsize:
+            self._idle.popitem(last=False)
+
+
+# Agent class, bound on first use (core.agent imports tools, so a top-level import would be circular)
+_Agent: Optional[type] = None
+
+
+def _agent_class() -> type:
+    """Return the Agent class, importing it only once."""
+    global _Agent
+    if _Agent is None:
+        from fastapi_agent.core.agent import Agent
+
+        _Agent = Agent
+    return _Agent
+
+
+# Tools without side effects; sub-agents limited to these can have their results cached
+READ_ONLY_TOOL_NAMES = frozenset({"read_file", "recall_notes", "search_knowledge", "get_skill"})
+
+
+class _RunStats:
+    """Log sink that keeps only the execution counters of a sub-agent run.
+
+    Passed to ``Agent.run(log_sink=...)`` so the sub-agent's log entries are
+    counted and dropped instead of accumulating for the whole run.
+    """
+
+    __slots__ = ("steps", "tool_calls", "errors")
+
+    def __init__(self) -> None:
+        self.steps = 0
+        self.tool_calls = 0
+        self.errors = 0
+
+    def __call__(self, log: Dict[str, Any]) -> None:
+        log_type = log.get("type")
+        if log_type == "step":
+            self.steps += 1
+        elif log_type == "tool_call":
+            self.tool_calls += 1
+        if log_type == "error" or not log.get("success", True):
+            self.errors += 1
+
+
+# Static sections of the sub-agent system prompt
+_GUIDELINES_BLOCK = """Your task has been delegated from a parent agent. Focus on completing it efficiently and thoroughly.
+
+## Guidelines
+- Stay focused on the assigned task - do not deviate
+- Be thorough but concise in your work
+- Use available tools when necessary
+- Report your findings and results clearly at the end
+- If you encounter blockers, explain them clearly
+
+## Important
+- You have independent context - you don't see the parent's conversation
+- Complete your task fully before finishing
+- Provide actionable results the parent can use
+"""
+
+_WORKSPACE_TMPL = """
+## Workspace
+You are working in: `{}`
+All relative paths are resolved from this directory.
+"""
+
+_DEPTH_TMPL = """
+## Sub-Agent Capability
+You can spawn sub-agents if needed (depth {}/{}).
+Use this sparingly and only for truly independent subtasks.
+"""
+
+_ROLE_TMPL = "You are a specialized AI assistant acting as a **{}**."
+_GENERIC_ROLE_LINE = "You are an AI assistant executing a delegated task."
+_CONTEXT_TMPL = "## Context from Parent Agent\n{}\n"
+
 
 class SpawnAgentTool(Tool):
     """Tool for spawning sub-agents to handle specific tasks autonomously.
@@ -15,6 +148,26 @@ class SpawnAgentTool(Tool):
     Similar to Claude Code's Task tool functionality.
     """
 
+    # Instance attributes live in slots. Tool itself has no __slots__, so a
+    # __dict__ remains for the cached_property values below.
+    __slots__ = (
+        "_llm_client",
+        "_parent_tools",
+        "_workspace_dir",
+        "_current_depth",
+        "_max_depth",
+        "_parent_logger",
+        "_default_max_steps",
+        "_default_token_limit",
+        "_max_parallel",
+        "_parent_prompt_cache_key",
+        "_child_spawn_tool",
+        "_inherited_tools",
+        "_result_cache_size",
+        "_result_cache",
+        "_agent_pool",
+    )
+
     def __init__(
         self,
         llm_client: "LLMClient",
@@ -25,6 +178,9 @@ class SpawnAgentTool(Tool):
         parent_logger: Optional["AgentLogger"] = None,
         default_max_steps: int = 15,
         default_token_limit: int = 50000,
+        max_parallel: int = 4,
+        parent_prompt_cache_key: Optional[str] = None,
+        result_cache_size: int = 0,
     ):
         """Initialize SpawnAgentTool.
 
@@ -37,6 +193,13 @@ class SpawnAgentTool(Tool):
             parent_logger: Optional parent agent's logger for event tracking
             default_max_steps: Default max steps for sub-agents
             default_token_limit: Default token limit for sub-agents
+            max_parallel: Maximum sub-agents run concurrently by execute_many
+            parent_prompt_cache_key: Prompt cache key shared by all sub-agents.
+                If not given, one is derived from each sub-agent's tool set.
+            result_cache_size: Maximum cached results of read-only sub-agent
+                runs. Disabled by default (0): the cache is never invalidated,
+                so only enable it when the files and notes the sub-agents read
+                do not change between spawns.
         """
         self._llm_client = llm_client
         self._parent_tools = parent_tools
@@ -46,12 +209,26 @@ class SpawnAgentTool(Tool):
         self._parent_logger = parent_logger
         self._default_max_steps = default_max_steps
         self._default_token_limit = default_token_limit
+        self._max_parallel = max_parallel
+        self._parent_prompt_cache_key = parent_prompt_cache_key
+        # Spawn tool handed to inheriting sub-agents (built once, see _build_sub_agent_tools)
+        self._child_spawn_tool: Optional["SpawnAgentTool"] = None
+        # Tools for sub-agents that inherit all parent tools (built on first use)
+        self._inherited_tools: Optional[Tuple[Tool, ...]] = None
+        # LRU cache of results from side-effect-free sub-agent runs
+        self._result_cache_size = result_cache_size
+        self._result_cache: "OrderedDict[str, ToolResult]" = OrderedDict()
+        # Idle sub-agents, reused across spawns of this tool only; the pool
+        # is dropped together with the tool at the end of the parent run
+        self._agent_pool = AgentPool()
 
     @property
     def name(self) -> str:
         return "spawn_agent"
 
-    @property
+    # description/parameters/instructions only depend on constructor arguments,
+    # so they are rendered once per tool instead of on every schema access.
+    @cached_property
     def description(self) -> str:
         return """Spawn a specialized sub-agent to handle a specific task autonomously.
 
@@ -69,7 +246,7 @@ Current depth: {depth}/{max_depth}""".format(
             max_depth=self._max_depth
         )
 
-    @property
+    @cached_property
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
@@ -101,7 +278,7 @@ Current depth: {depth}/{max_depth}""".format(
             "required": ["task"]
         }
 
-    @property
+    @cached_property
     def instructions(self) -> str:
         return """## Sub-Agent (spawn_agent) Usage Guidelines
 
@@ -159,28 +336,45 @@ spawn_agent(
         Returns:
             ToolResult with sub-agent's final response
         """
-        # Import here to avoid circular imports
-        from fastapi_agent.core.agent import Agent
-
         # Check depth limit
         if self._current_depth >= self._max_depth:
-            return ToolResult(
-                success=False,
-                error=f"Maximum agent nesting depth ({self._max_depth}) reached. Cannot spawn more sub-agents. Consider completing the task with available tools instead."
-            )
+            return self._depth_limit_result
 
         try:
             # Build sub-agent tools
             sub_tools = self._build_sub_agent_tools(tools)
+            # Sorted once; shared by the cache keys and the spawn log event
+            tool_names = tuple(sorted(tool.name for tool in sub_tools))
 
             # Build system prompt for sub-agent
-            system_prompt = self._build_sub_agent_prompt(role, context)
+            system_prompt = self._build_sub_agent_prompt_blocks(role, context)
 
             # Determine max_steps
             effective_max_steps = min(max_steps or self._default_max_steps, 30)
 
-            # Create sub-agent
-            sub_agent = Agent(
+            # Identical read-only sub-agent runs are served from the result cache
+            cache_key = self._result_cache_key(task, role, context, tool_names, effective_max_steps)
+            if cache_key is not None and cache_key in self._result_cache:
+                self._result_cache.move_to_end(cache_key)
+                if self._parent_logger is not None and self._parent_logger.enabled:
+                    self._parent_logger.log_event("SUB_AGENT_CACHE_HIT", {
+                        "task": task[:200],
+                        "role": role,
+                        "depth": self._current_depth + 1,
+                    })
+                return self._result_cache[cache_key]
+
+            # Create sub-agent (or reuse an idle one with the same configuration).
+            # Tools and LLM client are keyed by identity: pooled agents hold
+            # references to them, so the ids cannot be recycled while pooled.
+            pool_key = (
+                id(self._llm_client),
+                role,
+                tuple(id(tool) for tool in sub_tools),
+                hashlib.sha1("\n".join(block["text"] for block in system_prompt).encode()).hexdigest(),
+                self._default_token_limit,
+            )
+            sub_agent = self._agent_pool.checkout(pool_key, lambda: _agent_class()(
                 llm_client=self._llm_client,
                 system_prompt=system_prompt,
                 tools=sub_tools,
@@ -190,37 +384,40 @@ spawn_agent(
                 enable_summarization=True,
                 enable_logging=True,
                 name=f"sub_agent_d{self._current_depth + 1}_{role or 'general'}",
-            )
+                prompt_cache_key=self._prompt_cache_key(tool_names),
+            ))
+            sub_agent.max_steps = effective_max_steps
 
             # Log sub-agent spawn event
-            if self._parent_logger:
+            if self._parent_logger is not None and self._parent_logger.enabled:
                 self._parent_logger.log_event("SUB_AGENT_SPAWN", {
                     "task": task[:200],  # Truncate for logging
                     "role": role,
                     "depth": self._current_depth + 1,
                     "max_depth": self._max_depth,
-                    "tools": [t.name for t in sub_tools],
+                    "tools": list(tool_names),
                     "max_steps": effective_max_steps,
                 })
 
-            # Run sub-agent
-            sub_agent.add_user_message(task)
-            result, logs = await sub_agent.run()
-
-            # Calculate execution stats
-            steps_used = len([log for log in logs if log.get("type") == "step"])
-            tool_calls = len([log for log in logs if log.get("type") == "tool_call"])
-            errors = [log for log in logs if log.get("type") == "error" or not log.get("success", True)]
+            # Run sub-agent, aggregating execution stats as log entries arrive
+            stats = _RunStats()
+            try:
+                sub_agent.add_user_message(task)
+                result, _ = await sub_agent.run(log_sink=stats)
+            finally:
+                self._agent_pool.return_(pool_key, sub_agent)
+            steps_used = stats.steps
+            tool_calls = stats.tool_calls
 
             # Log completion event
-            if self._parent_logger:
+            if self._parent_logger is not None and self._parent_logger.enabled:
                 self._parent_logger.log_event("SUB_AGENT_COMPLETE", {
                     "task": task[:200],
                     "role": role,
                     "depth": self._current_depth + 1,
                     "steps_used": steps_used,
                     "tool_calls": tool_calls,
-                    "success": len(errors) == 0,
+                    "success": stats.errors == 0,
                 })
 
             # Format result for parent agent
@@ -233,12 +430,19 @@ spawn_agent(
                 max_steps=effective_max_steps,
             )
 
-            return ToolResult(success=True, content=formatted_result)
+            tool_result = ToolResult(success=True, content=formatted_result)
+            if cache_key is not None:
+                self._result_cache[cache_key] = tool_result
+                while len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+            return tool_result
 
+        # Failures are reported to the parent as a ToolResult; asyncio.CancelledError
+        # is a BaseException and propagates, so aborting a spawn stays cheap
         except Exception as e:
             error_msg = f"Sub-agent execution failed: {str(e)}"
 
-            if self._parent_logger:
+            if self._parent_logger is not None and self._parent_logger.enabled:
                 self._parent_logger.log_event("SUB_AGENT_ERROR", {
                     "task": task[:200],
                     "role": role,
@@ -247,112 +451,247 @@ spawn_agent(
 
             return ToolResult(success=False, error=error_msg)
 
-    def _build_sub_agent_tools(self, tool_names: Optional[List[str]]) -> List[Tool]:
+    async def execute_many(self, calls: List[Dict[str, Any]]) -> List[ToolResult]:
+        """Execute several independent sub-agents concurrently.
+
+        Used when the parent LLM emits multiple spawn_agent calls in one turn.
+        Concurrency is capped at ``max_parallel`` to avoid provider rate-limit
+        storms; results are returned in the same order as ``calls``.
+
+        Args:
+            calls: List of spawn_agent argument dicts
+
+        Returns:
+            List of ToolResult, one per call
+        """
+        return [result for result, _ in await self.execute_many_timed(calls)]
+
+    async def execute_many_timed(
+        self, calls: List[Dict[str, Any]]
+    ) -> List[Tuple[ToolResult, float]]:
+        """Like ``execute_many``, also returning each sub-agent's own run time.
+
+        The time is measured per call once it holds a concurrency slot, so a
+        sub-agent is not charged for the batch's wall-clock time.
+
+        Args:
+            calls: List of spawn_agent argument dicts
+
+        Returns:
+            List of (ToolResult, execution_time in seconds), one per call
+        """
+        # At the depth limit every call is rejected; skip the semaphore and gather
+        if self._current_depth >= self._max_depth:
+            return [(self._depth_limit_result, 0.0)] * len(calls)
+
+        semaphore = asyncio.Semaphore(self._max_parallel)
+
+        async def run_one(arguments: Dict[str, Any]) -> Tuple[ToolResult, float]:
+            async with semaphore:
+                start_time = time.time()
+                try:
+                    result = await self.execute(**arguments)
+                except Exception as e:
+                    # CancelledError is not an Exception and propagates
+                    result = ToolResult(success=False, error=f"Sub-agent execution failed: {str(e)}")
+                return result, time.time() - start_time
+
+        outcomes = await asyncio.gather(
+            *(run_one(arguments) for arguments in calls),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                # Cancellation is not a sub-agent failure; let it propagate
+                raise outcome
+        return outcomes
+
+    def _build_sub_agent_tools(self, tool_names: Optional[List[str]]) -> Tuple[Tool, ...]:
         """Build tool list for sub-agent.
 
         Args:
             tool_names: Optional list of specific tool names to include
 
         Returns:
-            List of Tool instances for sub-agent
+            Tuple of Tool instances for sub-agent (the inherited tuple is the
+            same object on every call)
         """
+        # Sub-agents at max depth get no spawn_agent, so no nested tool is built for them
+        can_nest = self._current_depth + 1 < self._max_depth
+
         if tool_names is not None:
             # Filter to requested tools only
             tools = []
             for name in tool_names:
-                if name in self._parent_tools:
-                    tool = self._parent_tools[name]
-                    # Don't include spawn_agent if at max depth - 1
-                    if name == "spawn_agent" and self._current_depth + 1 >= self._max_depth:
-                        continue
-                    tools.append(tool)
-            return tools
-
-        # Inherit all parent tools
+                if name not in self._parent_tools:
+                    continue
+                if name == "spawn_agent" and not can_nest:
+                    continue
+                tools.append(self._parent_tools[name])
+            return tuple(tools)
+
+        # Inherit all parent tools. parent_tools is fixed for this tool's
+        # lifetime, so the inherited tuple is built once and shared
+        if self._inherited_tools is not None:
+            return self._inherited_tools
+
         tools = []
         for name, tool in self._parent_tools.items():
-            if name == "spawn_agent":
-                # Create new SpawnAgentTool with incremented depth
-                if self._current_depth + 1 < self._max_depth:
-                    new_spawn_tool = SpawnAgentTool(
-                        llm_client=self._llm_client,
-                        parent_tools=self._parent_tools,
-                        workspace_dir=self._workspace_dir,
-                        current_depth=self._current_depth + 1,
-                        max_depth=self._max_depth,
-                        parent_logger=self._parent_logger,
-                        default_max_steps=self._default_max_steps,
-                        default_token_limit=self._default_token_limit,
-                    )
-                    tools.append(new_spawn_tool)
-                # else: skip spawn_agent at max depth
-            else:
+            if name != "spawn_agent":
                 tools.append(tool)
+                continue
+            if not can_nest:
+                continue
+            # SpawnAgentTool with incremented depth; its configuration only
+            # depends on this tool's fixed fields, so it is built once
+            if self._child_spawn_tool is None:
+                self._child_spawn_tool = SpawnAgentTool(
+                    llm_client=self._llm_client,
+                    parent_tools=self._parent_tools,
+                    workspace_dir=self._workspace_dir,
+                    current_depth=self._current_depth + 1,
+                    max_depth=self._max_depth,
+                    parent_logger=self._parent_logger,
+                    default_max_steps=self._default_max_steps,
+                    default_token_limit=self._default_token_limit,
+                    max_parallel=self._max_parallel,
+                    parent_prompt_cache_key=self._parent_prompt_cache_key,
+                    result_cache_size=self._result_cache_size,
+                )
+            tools.append(self._child_spawn_tool)
+
+        self._inherited_tools = tuple(tools)
+        return self._inherited_tools
+
+    def _result_cache_key(
+        self,
+        task: str,
+        role: Optional[str],
+        context: Optional[str],
+        tool_names: Tuple[str, ...],
+        max_steps: int,
+    ) -> Optional[str]:
+        """Get the result cache key for a sub-agent run.
+
+        Only runs whose tools are all read-only are cacheable; anything that
+        can write files, run commands or spawn further agents has side effects
+        and is always executed.
+
+        Args:
+            task: Task for the sub-agent
+            role: Optional sub-agent role
+            context: Optional context from the parent
+            tool_names: Sorted names of the sub-agent's tools
+            max_steps: Effective max steps
+
+        Returns:
+            Cache key, or None if the run must not be cached
+        """
+        if self._result_cache_size <= 0:
+            return None
+        if not READ_ONLY_TOOL_NAMES.issuperset(tool_names):
+            return None
+
+        signature = "\x00".join([
+            task,
+            role or "",
+            context or "",
+            self._workspace_dir,
+            str(max_steps),
+            *tool_names,
+        ])
+        return hashlib.blake2b(signature.encode(), digest_size=16).hexdigest()
+
+    def _prompt_cache_key(self, tool_names: Tuple[str, ...]) -> str:
+        """Get the prompt cache key for a sub-agent.
+
+        Sibling sub-agents share the same static prompt prefix and tool
+        schemas, so they should land on the same provider cache shard rather
+        than each paying the cache-write cost.
+
+        Args:
+            tool_names: Sorted names of the tools the sub-agent is created with
+
+        Returns:
+            Prompt cache key string
+        """
+        if self._parent_prompt_cache_key:
+            return self._parent_prompt_cache_key
+
+        signature = "|".join([
+            self._workspace_dir,
+            str(self._current_depth + 1),
+            *tool_names,
+        ])
+        return "sub_agent_" + hashlib.sha1(signature.encode()).hexdigest()
+
+    @cached_property
+    def _depth_limit_result(self) -> ToolResult:
+        """Rejection returned for every spawn once the depth limit is reached.
 
-        return tools
+        Depends only on fixed fields and is never mutated, so one instance is shared.
+        """
+        return ToolResult(
+            success=False,
+            error=f"Maximum agent nesting depth ({self._max_depth}) reached. Cannot spawn more sub-agents. Consider completing the task with available tools instead."
+        )
+
+    @cached_property
+    def _static_prompt_text(self) -> str:
+        """Guidelines, workspace and depth sections of the sub-agent prompt.
 
-    def _build_sub_agent_prompt(
+        Only depends on this tool's fixed fields, so it is rendered once.
+        """
+        depth_block = ""
+        if self._current_depth + 1 < self._max_depth:
+            depth_block = _DEPTH_TMPL.format(self._current_depth + 1, self._max_depth)
+        return "".join((
+            _GUIDELINES_BLOCK,
+            _WORKSPACE_TMPL.format(self._workspace_dir),
+            depth_block,
+        ))
+
+    @cached_property
+    def _static_prompt_block(self) -> Dict[str, Any]:
+        """Cached content block holding ``_static_prompt_text``."""
+        return {"type": "text", "text": self._static_prompt_text, "cache_control": {"type": "ephemeral"}}
+
+    def _build_sub_agent_prompt_blocks(
         self,
         role: Optional[str],
         context: Optional[str]
-    ) -> str:
-        """Build system prompt for sub-agent.
+    ) -> List[Dict[str, Any]]:
+        """Build system prompt for sub-agent as cacheable content blocks.
+
+        The prompt is ordered from most to least stable so providers with
+        prompt caching (Anthropic, Gemini) can reuse the prefix across
+        sibling sub-agents:
+
+        1. Guidelines, workspace and depth info - identical for every
+           sub-agent spawned by this tool (cached)
+        2. Role definition - shared by sub-agents with the same role (cached)
+        3. Context from parent - specific to this spawn (not cached)
 
         Args:
             role: Optional specialized role
             context: Optional context from parent
 
         Returns:
-            System prompt string
+            List of text content blocks
         """
-        parts = []
-
         # Role definition
-        if role:
-            parts.append(f"You are a specialized AI assistant acting as a **{role}**.")
-        else:
-            parts.append("You are an AI assistant executing a delegated task.")
-
-        # Core instructions
-        parts.append("""
-Your task has been delegated from a parent agent. Focus on completing it efficiently and thoroughly.
-
-## Guidelines
-- Stay focused on the assigned task - do not deviate
-- Be thorough but concise in your work
-- Use available tools when necessary
-- Report your findings and results clearly at the end
-- If you encounter blockers, explain them clearly
+        role_text = _ROLE_TMPL.format(role) if role else _GENERIC_ROLE_LINE
 
-## Important
-- You have independent context - you don't see the parent's conversation
-- Complete your task fully before finishing
-- Provide actionable results the parent can use
-""")
+        blocks = [
+            self._static_prompt_block,
+            {"type": "text", "text": role_text, "cache_control": {"type": "ephemeral"}},
+        ]
 
         # Context from parent
         if context:
-            parts.append(f"""
-## Context from Parent Agent
-{context}
-""")
+            blocks.append({"type": "text", "text": _CONTEXT_TMPL.format(context)})
 
-        # Workspace info
-        parts.append(f"""
-## Workspace
-You are working in: `{self._workspace_dir}`
-All relative paths are resolved from this directory.
-""")
-
-        # Depth info
-        if self._current_depth + 1 < self._max_depth:
-            parts.append(f"""
-## Sub-Agent Capability
-You can spawn sub-agents if needed (depth {self._current_depth + 1}/{self._max_depth}).
-Use this sparingly and only for truly independent subtasks.
-""")
-
-        return "\n".join(parts)
+        return blocks
 
     def _format_result(
         self,
@@ -381,15 +720,17 @@ Use this sparingly and only for truly independent subtasks.
             header += f" ({role})"
 
         # Truncate task if too long
-        task_display = task[:300] + "..." if len(task) > 300 else task
-
-        return f"""{header}
-
-**Task:** {task_display}
-**Execution:** {steps_used}/{max_steps} steps, {tool_calls} tool calls
-**Depth:** {self._current_depth + 1}/{self._max_depth}
-
----
-
-{result}
-"""
+        task_display = task if len(task) <= 300 else f"{task[:300]}..."
+
+        return "\n".join((
+            header,
+            "",
+            f"**Task:** {task_display}",
+            f"**Execution:** {steps_used}/{max_steps} steps, {tool_calls} tool calls",
+            f"**Depth:** {self._current_depth + 1}/{self._max_depth}",
+            "",
+            "---",
+            "",
+            result,
+            "",
+        ))
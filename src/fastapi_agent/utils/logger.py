@@ -2,8 +2,16 @@
 Logging utilities for FastAPI Agent
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+
+from fastapi_agent.core.config import settings
+
+# 日志级别，通过配置项 LOG_LEVEL 调整（如生产环境设为 WARNING，跳过 INFO 日志的格式化）
+LOG_LEVEL = logging.getLevelName(settings.LOG_LEVEL)
 
 # 创建全局logger
 logger = logging.getLogger("fastapi_agent")
@@ -11,11 +19,11 @@ logger = logging.getLogger("fastapi_agent")
 # 如果还没有配置handler，则配置
 if not logger.handlers:
     # 设置日志级别
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
 
     # 创建控制台handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(LOG_LEVEL)
 
     # 创建格式器
     formatter = logging.Formatter(
@@ -26,8 +34,14 @@ if not logger.handlers:
     # 设置格式器
     console_handler.setFormatter(formatter)
 
+    # 通过队列交给后台线程写入 stdout，并发的 agent 不会在 stdout 锁上互相阻塞
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(_log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
     # 添加handler
-    logger.addHandler(console_handler)
+    logger.addHandler(QueueHandler(_log_queue))
 
 # 防止日志传播到根logger
 logger.propagate = False
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from fastapi_agent.core.llm_client import LLMClient
+from fastapi_agent.schemas.message import Message
+
+
+def _completion(prompt_tokens=100, cached_tokens=0):
+    message = SimpleNamespace(content="ok", tool_calls=None)
+    usage = SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=5,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+    )
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=message, finish_reason="stop")],
+        usage=usage,
+    )
+
+
+class TestPromptCaching:
+    """Test system prompt cache breakpoints and cached-token accounting."""
+
+    def test_anthropic_system_prompt_gets_breakpoint(self):
+        """Test that a plain system prompt is marked cacheable for Anthropic."""
+        client = LLMClient(api_key="k", model="anthropic/claude-3-5-sonnet-20241022")
+
+        message = client._system_api_message("You are helpful.")
+
+        assert message["content"] == [
+            {"type": "text", "text": "You are helpful.", "cache_control": {"type": "ephemeral"}}
+        ]
+
+    def test_other_providers_keep_plain_prompt(self):
+        """Test that providers with automatic prefix caching get the prompt unchanged."""
+        client = LLMClient(api_key="k", model="openai/gpt-4o")
+
+        assert client._system_api_message("You are helpful.")["content"] == "You are helpful."
+
+    def test_content_blocks_are_passed_through(self):
+        """Test that prompts already split into blocks keep their own breakpoints."""
+        client = LLMClient(api_key="k", model="anthropic/claude-3-5-sonnet-20241022")
+        blocks = [{"type": "text", "text": "static", "cache_control": {"type": "ephemeral"}},
+                  {"type": "text", "text": "dynamic"}]
+
+        assert client._system_api_message(blocks)["content"] is blocks
+
+    @pytest.mark.asyncio
+    async def test_cached_tokens_reported_in_usage(self):
+        """Test that provider cached-token counts land in TokenUsage."""
+        client = LLMClient(api_key="k", model="openai/gpt-4o")
+        client.retry_config.enabled = False
+
+        with patch("fastapi_agent.core.llm_client.acompletion",
+                   new=AsyncMock(return_value=_completion(cached_tokens=80))):
+            response = await client.generate([
+                Message(role="system", content="You are helpful."),
+                Message(role="user", content="hi"),
+            ])
+
+        assert response.usage.input_tokens == 100
+        assert response.usage.cache_read_input_tokens == 80
@@ -1,25 +1,51 @@
 """Tests for Team functionality."""
 
+import itertools
+import re
+
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, AsyncMock
 
-from fastapi_agent.core.team import Team
-from fastapi_agent.core.llm_client import LLMClient
-from fastapi_agent.schemas.team import TeamConfig, TeamMemberConfig, TaskWithDependencies
-from fastapi_agent.tools.file_tools import ReadTool, WriteTool
+from fastapi_agent.core.team import Team, _RunSummary
+from fastapi_agent.schemas.message import LLMResponse
+from fastapi_agent.schemas.team import MemberRunResult, TeamConfig, TeamMemberConfig, TaskWithDependencies
 
 
-@pytest.fixture
+class _StubLLM:
+    """Minimal LLMClient stand-in (Team only hands it to the, usually patched, Agent)."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, *args, **kwargs) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(content="ok")
+
+
+# Expected error patterns, compiled once
+_CIRCULAR_RE = re.compile("Circular dependency")
+_MISSING_DEP_RE = re.compile("non-existent")
+
+
+def _task(id, task, assigned_to, depends_on=None):
+    """Build a trusted TaskWithDependencies literal without running validation."""
+    return TaskWithDependencies.model_construct(
+        id=id, task=task, assigned_to=assigned_to, depends_on=depends_on or []
+    )
+
+
+# Fixtures below are never mutated by the tests (each test builds its own Team),
+# so they are created once per module.
+@pytest.fixture(scope="module")
 def llm_client():
-    """Create a mock LLM client."""
-    client = Mock(spec=LLMClient)
-    return client
+    """Create a stub LLM client."""
+    return _StubLLM()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_team_config():
-    """Create a sample team configuration."""
-    return TeamConfig(
+    """Create a sample team configuration (trusted literal, so validation is skipped)."""
+    return TeamConfig.model_construct(
         name="Research Team",
         description="A team for research tasks",
         members=[
@@ -43,22 +69,51 @@ def sample_team_config():
 
 
 @pytest.fixture
+def team(llm_client, sample_team_config, available_tools):
+    """Create a fresh Team for each test."""
+    return Team(
+        config=sample_team_config,
+        llm_client=llm_client,
+        available_tools=available_tools
+    )
+
+
+@pytest.fixture
+def run_member_mock(team, monkeypatch):
+    """Patch the Team's _run_member with a fresh AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(team, "_run_member", mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def _fast_ids(monkeypatch):
+    """Replace Team's uuid4 with a deterministic counter."""
+    counter = itertools.count()
+    monkeypatch.setattr("fastapi_agent.core.team.uuid4", lambda: f"tid-{next(counter)}")
+
+
+@pytest.fixture(autouse=True)
+def patch_agent(monkeypatch):
+    """Replace the Agent class used by Team with a mock."""
+    mock = Mock()
+    monkeypatch.setattr("fastapi_agent.core.team.Agent", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
 def available_tools():
     """Create list of available tools."""
+    from fastapi_agent.tools.file_tools import ReadTool, WriteTool
+
     return [
         ReadTool(),
         WriteTool()
     ]
 
 
-def test_team_initialization(llm_client, sample_team_config, available_tools):
+def test_team_initialization(team):
     """Test team initialization."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     assert team.config.name == "Research Team"
     assert len(team.config.members) == 2
     assert team.team_id is not None
@@ -72,14 +127,8 @@ def test_team_initialization(llm_client, sample_team_config, available_tools):
 # for tests of the new mechanism.
 
 
-def test_build_leader_system_prompt(llm_client, sample_team_config, available_tools):
+def test_build_leader_system_prompt(team):
     """Test building leader system prompt."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     prompt = team._build_leader_system_prompt()
 
     # Check key sections
@@ -117,14 +166,8 @@ def test_build_leader_system_prompt_delegate_all(llm_client, available_tools):
     assert "Focus on innovative solutions" in prompt
 
 
-def test_run_member_success(llm_client, sample_team_config, available_tools):
+def test_run_member_success(team, sample_team_config, patch_agent):
     """Test running a team member successfully."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     # Mock agent run
     mock_response = {
         "success": True,
@@ -132,79 +175,54 @@ def test_run_member_success(llm_client, sample_team_config, available_tools):
         "steps": 3
     }
 
-    with patch("fastapi_agent.core.team.Agent") as MockAgent:
-        mock_agent_instance = Mock()
-        mock_agent_instance.run.return_value = mock_response
-        MockAgent.return_value = mock_agent_instance
+    patch_agent.return_value.run.return_value = mock_response
 
-        member_config = sample_team_config.members[0]
-        result = team._run_member(member_config, "Find information about Python")
+    member_config = sample_team_config.members[0]
+    result = team._run_member(member_config, "Find information about Python")
 
-        assert result.success is True
-        assert result.member_name == "Researcher"
-        assert result.response == "Research completed"
-        assert result.steps == 3
-        assert len(team.member_runs) == 1
+    assert result.success is True
+    assert result.member_name == "Researcher"
+    assert result.response == "Research completed"
+    assert result.steps == 3
+    assert len(team.member_runs) == 1
 
 
-def test_run_member_with_tools(llm_client, sample_team_config, available_tools):
+def test_run_member_with_tools(team, sample_team_config, patch_agent):
     """Test running a team member with specific tools."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     mock_response = {
         "success": True,
         "message": "File written",
         "steps": 2
     }
 
-    with patch("fastapi_agent.core.team.Agent") as MockAgent:
-        mock_agent_instance = Mock()
-        mock_agent_instance.run.return_value = mock_response
-        MockAgent.return_value = mock_agent_instance
+    patch_agent.return_value.run.return_value = mock_response
 
-        # Writer has write_file tool
-        member_config = sample_team_config.members[1]
-        result = team._run_member(member_config, "Write documentation")
+    # Writer has write_file tool
+    member_config = sample_team_config.members[1]
+    result = team._run_member(member_config, "Write documentation")
 
-        # Check that agent was created with write_file tool
-        call_args = MockAgent.call_args
-        agent_tools = call_args[1]["tools"]
+    # Check that agent was created with write_file tool
+    call_args = patch_agent.call_args
+    agent_tools = call_args[1]["tools"]
 
-        assert result.success is True
-        assert result.member_name == "Writer"
+    assert result.success is True
+    assert result.member_name == "Writer"
 
 
-def test_run_member_error(llm_client, sample_team_config, available_tools):
+def test_run_member_error(team, sample_team_config, patch_agent):
     """Test handling member run error."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
-    with patch("fastapi_agent.core.team.Agent") as MockAgent:
-        MockAgent.side_effect = Exception("Agent failed")
+    patch_agent.side_effect = Exception("Agent failed")
 
-        member_config = sample_team_config.members[0]
-        result = team._run_member(member_config, "Some task")
+    member_config = sample_team_config.members[0]
+    result = team._run_member(member_config, "Some task")
 
-        assert result.success is False
-        assert result.error == "Agent failed"
-        assert len(team.member_runs) == 1
+    assert result.success is False
+    assert result.error == "Agent failed"
+    assert len(team.member_runs) == 1
 
 
-def test_team_run_integration(llm_client, sample_team_config, available_tools):
+def test_team_run_integration(team, patch_agent):
     """Test full team run integration."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     # Mock leader agent run
     mock_leader_response = {
         "success": True,
@@ -212,136 +230,97 @@ def test_team_run_integration(llm_client, sample_team_config, available_tools):
         "steps": 5
     }
 
-    with patch("fastapi_agent.core.team.Agent") as MockAgent:
-        mock_agent_instance = Mock()
-        mock_agent_instance.run.return_value = mock_leader_response
-        MockAgent.return_value = mock_agent_instance
-
-        response = team.run("Research Python and create documentation")
-
-        assert response.success is True
-        assert response.team_name == "Research Team"
-        assert response.message == "Task completed by delegating to team members"
-        assert "leader_response" in response.metadata
-        assert "team_config" in response.metadata
-
-
-def test_resolve_dependencies_simple_chain(llm_client, sample_team_config, available_tools):
-    """Test resolving dependencies for a simple linear chain."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
-    tasks = [
-        TaskWithDependencies(id="task1", task="First", assigned_to="Researcher"),
-        TaskWithDependencies(id="task2", task="Second", assigned_to="Writer", depends_on=["task1"]),
-        TaskWithDependencies(id="task3", task="Third", assigned_to="Researcher", depends_on=["task2"])
-    ]
-
-    layers = team._resolve_dependencies(tasks)
+    patch_agent.return_value.run.return_value = mock_leader_response
 
-    assert len(layers) == 3
-    assert len(layers[0]) == 1
-    assert layers[0][0].id == "task1"
-    assert len(layers[1]) == 1
-    assert layers[1][0].id == "task2"
-    assert len(layers[2]) == 1
-    assert layers[2][0].id == "task3"
+    response = team.run("Research Python and create documentation")
 
+    assert response.success is True
+    assert response.team_name == "Research Team"
+    assert response.message == "Task completed by delegating to team members"
+    assert "leader_response" in response.metadata
+    assert "team_config" in response.metadata
 
-def test_resolve_dependencies_parallel(llm_client, sample_team_config, available_tools):
-    """Test resolving dependencies with parallel tasks."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
 
-    tasks = [
-        TaskWithDependencies(id="task1", task="Root", assigned_to="Researcher"),
-        TaskWithDependencies(id="task2", task="Branch1", assigned_to="Writer", depends_on=["task1"]),
-        TaskWithDependencies(id="task3", task="Branch2", assigned_to="Researcher", depends_on=["task1"])
+def test_run_summary_collects_logs_in_one_pass():
+    """Test that the run log sink keeps the logs and summarizes them."""
+    summary = _RunSummary()
+    entries = [
+        {"type": "step", "step": 1},
+        {"type": "tool_call", "tool": "read_file"},
+        {"type": "step", "step": 2},
+        {"type": "max_steps_reached", "total_input_tokens": 120, "total_output_tokens": 30},
     ]
+    for entry in entries:
+        summary(entry)
 
-    layers = team._resolve_dependencies(tasks)
-
-    assert len(layers) == 2
-    assert len(layers[0]) == 1
-    assert layers[0][0].id == "task1"
-    assert len(layers[1]) == 2
-    task_ids = {task.id for task in layers[1]}
-    assert task_ids == {"task2", "task3"}
+    assert summary.logs == entries
+    assert summary.steps == 2
+    assert summary.max_steps_reached is True
+    assert (summary.input_tokens, summary.output_tokens) == (120, 30)
 
 
-def test_resolve_dependencies_complex_dag(llm_client, sample_team_config, available_tools):
-    """Test resolving dependencies for a complex DAG."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
-    tasks = [
-        TaskWithDependencies(id="t1", task="Research", assigned_to="Researcher"),
-        TaskWithDependencies(id="t2", task="Analyze", assigned_to="Researcher", depends_on=["t1"]),
-        TaskWithDependencies(id="t3", task="Write", assigned_to="Writer", depends_on=["t2"]),
-        TaskWithDependencies(id="t4", task="Code", assigned_to="Researcher", depends_on=["t2"]),
-        TaskWithDependencies(id="t5", task="Review", assigned_to="Writer", depends_on=["t3", "t4"])
-    ]
-
-    layers = team._resolve_dependencies(tasks)
+@pytest.mark.parametrize("tasks,expected", [
+    pytest.param(
+        [
+            _task("task1", "First", "Researcher"),
+            _task("task2", "Second", "Writer", ["task1"]),
+            _task("task3", "Third", "Researcher", ["task2"]),
+        ],
+        [{"task1"}, {"task2"}, {"task3"}],
+        id="simple_chain",
+    ),
+    pytest.param(
+        [
+            _task("task1", "Root", "Researcher"),
+            _task("task2", "Branch1", "Writer", ["task1"]),
+            _task("task3", "Branch2", "Researcher", ["task1"]),
+        ],
+        [{"task1"}, {"task2", "task3"}],
+        id="parallel",
+    ),
+    pytest.param(
+        [
+            _task("t1", "Research", "Researcher"),
+            _task("t2", "Analyze", "Researcher", ["t1"]),
+            _task("t3", "Write", "Writer", ["t2"]),
+            _task("t4", "Code", "Researcher", ["t2"]),
+            _task("t5", "Review", "Writer", ["t3", "t4"]),
+        ],
+        [{"t1"}, {"t2"}, {"t3", "t4"}, {"t5"}],
+        id="complex_dag",
+    ),
+])
+def test_resolve_dependencies_layers(tasks, expected):
+    """Test that tasks are grouped into dependency layers."""
+    layers = Team._resolve_dependencies(tasks)
 
-    assert len(layers) == 4
-    assert layers[0][0].id == "t1"
-    assert layers[1][0].id == "t2"
-    assert {task.id for task in layers[2]} == {"t3", "t4"}
-    assert layers[3][0].id == "t5"
+    assert [{task.id for task in layer} for layer in layers] == expected
 
 
-def test_resolve_dependencies_circular_error(llm_client, sample_team_config, available_tools):
+def test_resolve_dependencies_circular_error():
     """Test that circular dependencies are detected."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     tasks = [
-        TaskWithDependencies(id="task1", task="First", assigned_to="Researcher", depends_on=["task2"]),
-        TaskWithDependencies(id="task2", task="Second", assigned_to="Writer", depends_on=["task1"])
+        _task("task1", "First", "Researcher", ["task2"]),
+        _task("task2", "Second", "Writer", ["task1"])
     ]
 
-    with pytest.raises(ValueError, match="Circular dependency"):
-        team._resolve_dependencies(tasks)
+    with pytest.raises(ValueError, match=_CIRCULAR_RE):
+        Team._resolve_dependencies(tasks)
 
 
-def test_resolve_dependencies_missing_dependency(llm_client, sample_team_config, available_tools):
+def test_resolve_dependencies_missing_dependency():
     """Test that missing dependencies are detected."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     tasks = [
-        TaskWithDependencies(id="task1", task="First", assigned_to="Researcher", depends_on=["nonexistent"])
+        _task("task1", "First", "Researcher", ["nonexistent"])
     ]
 
-    with pytest.raises(ValueError, match="non-existent"):
-        team._resolve_dependencies(tasks)
+    with pytest.raises(ValueError, match=_MISSING_DEP_RE):
+        Team._resolve_dependencies(tasks)
 
 
 @pytest.mark.asyncio
-async def test_execute_task_with_context(llm_client, sample_team_config, available_tools):
+async def test_execute_task_with_context(team, run_member_mock):
     """Test executing a task with dependency context."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     task = TaskWithDependencies(
         id="task2",
         task="Analyze results",
@@ -353,33 +332,25 @@ async def test_execute_task_with_context(llm_client, sample_team_config, availab
         "task1": "Research findings: Python is great"
     }
 
-    with patch.object(team, '_run_member', new_callable=AsyncMock) as mock_run_member:
-        from fastapi_agent.schemas.team import MemberRunResult
-        mock_run_member.return_value = MemberRunResult(
-            member_name="Researcher",
-            member_role="Information gathering specialist",
-            task="Analyze results",
-            response="Analysis complete",
-            success=True,
-            steps=2
-        )
+    run_member_mock.return_value = MemberRunResult(
+        member_name="Researcher",
+        member_role="Information gathering specialist",
+        task="Analyze results",
+        response="Analysis complete",
+        success=True,
+        steps=2
+    )
 
-        result = await team._execute_task_with_context(task, completed_results)
+    result = await team._execute_task_with_context(task, completed_results)
 
-        assert result.status == "completed"
-        assert result.result == "Analysis complete"
-        assert "task1" in mock_run_member.call_args[0][1]
+    assert result.status == "completed"
+    assert result.result == "Analysis complete"
+    assert "task1" in run_member_mock.call_args[0][1]
 
 
 @pytest.mark.asyncio
-async def test_execute_task_member_not_found(llm_client, sample_team_config, available_tools):
+async def test_execute_task_member_not_found(team):
     """Test executing a task with non-existent member role."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     task = TaskWithDependencies(
         id="task1",
         task="Do something",
@@ -393,84 +364,67 @@ async def test_execute_task_member_not_found(llm_client, sample_team_config, ava
 
 
 @pytest.mark.asyncio
-async def test_run_with_dependencies_success(llm_client, sample_team_config, available_tools):
+async def test_run_with_dependencies_success(team, run_member_mock):
     """Test successful execution of dependency-based workflow."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     tasks = [
         TaskWithDependencies(id="research", task="Research topic", assigned_to="Information gathering specialist"),
         TaskWithDependencies(id="write", task="Write article", assigned_to="Documentation specialist", depends_on=["research"])
     ]
 
-    with patch.object(team, '_run_member', new_callable=AsyncMock) as mock_run_member:
-        from fastapi_agent.schemas.team import MemberRunResult
-
-        async def mock_run_side_effect(member_config, task_desc, session_id=None):
-            if "Research" in task_desc:
-                return MemberRunResult(
-                    member_name="Researcher",
-                    member_role="Information gathering specialist",
-                    task=task_desc,
-                    response="Research complete: Findings here",
-                    success=True,
-                    steps=3
-                )
-            else:
-                return MemberRunResult(
-                    member_name="Writer",
-                    member_role="Documentation specialist",
-                    task=task_desc,
-                    response="Article written",
-                    success=True,
-                    steps=2
-                )
-
-        mock_run_member.side_effect = mock_run_side_effect
-
-        result = await team.run_with_dependencies(tasks)
-
-        assert result.success is True
-        assert len(result.tasks) == 2
-        assert result.tasks[0].status == "completed"
-        assert result.tasks[1].status == "completed"
-        assert len(result.execution_order) == 2
-        assert result.execution_order[0] == ["research"]
-        assert result.execution_order[1] == ["write"]
+    async def mock_run_side_effect(member_config, task_desc, session_id=None):
+        if "Research" in task_desc:
+            return MemberRunResult(
+                member_name="Researcher",
+                member_role="Information gathering specialist",
+                task=task_desc,
+                response="Research complete: Findings here",
+                success=True,
+                steps=3
+            )
+        else:
+            return MemberRunResult(
+                member_name="Writer",
+                member_role="Documentation specialist",
+                task=task_desc,
+                response="Article written",
+                success=True,
+                steps=2
+            )
+
+    run_member_mock.side_effect = mock_run_side_effect
+
+    result = await team.run_with_dependencies(tasks)
+
+    assert result.success is True
+    assert len(result.tasks) == 2
+    assert result.tasks[0].status == "completed"
+    assert result.tasks[1].status == "completed"
+    assert len(result.execution_order) == 2
+    assert result.execution_order[0] == ["research"]
+    assert result.execution_order[1] == ["write"]
 
 
 @pytest.mark.asyncio
-async def test_run_with_dependencies_failure_stops_dependents(llm_client, sample_team_config, available_tools):
+async def test_run_with_dependencies_failure_stops_dependents(team, run_member_mock):
     """Test that task failure stops dependent tasks."""
-    team = Team(
-        config=sample_team_config,
-        llm_client=llm_client,
-        available_tools=available_tools
-    )
-
     tasks = [
         TaskWithDependencies(id="t1", task="Task 1", assigned_to="Information gathering specialist"),
         TaskWithDependencies(id="t2", task="Task 2", assigned_to="Documentation specialist", depends_on=["t1"])
     ]
 
-    with patch.object(team, '_run_member', new_callable=AsyncMock) as mock_run_member:
-        from fastapi_agent.schemas.team import MemberRunResult
-        mock_run_member.return_value = MemberRunResult(
-            member_name="Researcher",
-            member_role="Information gathering specialist",
-            task="Task 1",
-            response="",
-            success=False,
-            error="Task failed",
-            steps=1
-        )
-
-        result = await team.run_with_dependencies(tasks)
-
-        assert result.success is False
-        assert tasks[0].status == "failed"
-        assert tasks[1].status == "skipped"
-        assert "dependency failure" in tasks[1].result.lower()
+    run_member_mock.return_value = MemberRunResult(
+        member_name="Researcher",
+        member_role="Information gathering specialist",
+        task="Task 1",
+        response="",
+        success=False,
+        error="Task failed",
+        steps=1
+    )
+
+    result = await team.run_with_dependencies(tasks)
+
+    assert result.success is False
+    assert tasks[0].status == "failed"
+    assert tasks[1].status == "skipped"
+    assert "dependency failure" in tasks[1].result.lower()
@@ -0,0 +1,25 @@
+from unittest.mock import MagicMock
+
+from fastapi_agent.core.llm_client import LLMClient
+from fastapi_agent.core.token_manager import TokenManager, get_shared_encoding
+
+
+class TestSharedEncoding:
+    """Test that token managers share one tokenizer."""
+
+    def test_managers_share_encoding(self):
+        """Test that separate managers reuse the process-wide encoder."""
+        llm = MagicMock(spec=LLMClient)
+        first = TokenManager(llm_client=llm)
+        second = TokenManager(llm_client=llm, token_limit=1000)
+
+        assert first.encoding is second.encoding
+        assert first.encoding is get_shared_encoding()
+
+    def test_injected_encoding_is_used(self):
+        """Test that a pre-built encoder skips the shared lookup."""
+        encoding = MagicMock()
+        manager = TokenManager(llm_client=MagicMock(spec=LLMClient), encoding=encoding)
+
+        assert manager.encoding is encoding
+        assert manager.tiktoken_available
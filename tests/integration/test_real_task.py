@@ -10,6 +10,8 @@ Run with: uv run python tests/integration/test_real_task.py
 
 import asyncio
 import sys
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi_agent.core.agent import Agent
@@ -18,6 +20,12 @@ from fastapi_agent.core.llm_client import LLMClient
 from fastapi_agent.tools.file_tools import ReadTool
 from fastapi_agent.tools.spawn_agent_tool import SpawnAgentTool
 
+# Paths are resolved once at import
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_SPAWN_TOOL_FILE = _REPO_ROOT / "src/fastapi_agent/tools/spawn_agent_tool.py"
+_BASE_TOOL_FILE = _REPO_ROOT / "src/fastapi_agent/tools/base.py"
+_WORKSPACE = str(_REPO_ROOT)
+_EMPTY_ARGS: dict = {}
 
 SYSTEM_PROMPT = """你是一个代码质量分析协调员。
 
@@ -31,7 +39,40 @@ SYSTEM_PROMPT = """你是一个代码质量分析协调员。
 - security_auditor: 安全审计员，检查安全漏洞
 - code_reviewer: 代码评审员，检查代码风格和最佳实践
 
-重要：你必须使用 spawn_agent 来委派分析任务，不要自己直接分析代码。"""
+重要：你必须使用 spawn_agent 来委派分析任务，不要自己直接分析代码。
+各个子Agent的分析互不依赖，请在同一回合内一次性发出所有 spawn_agent 调用，它们会被并行执行。"""
+
+
+class _LogSummary:
+    """Log sink that keeps a compact record of each execution log entry.
+
+    Passed to ``Agent.run(log_sink=...)`` instead of collecting the full logs:
+    tool outputs and LLM content are dropped as they arrive, and only a bounded
+    window of ``(type, tool, step, spawn_details)`` records is retained.
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(self, maxlen: int = 1024) -> None:
+        self.entries: deque = deque(maxlen=maxlen)
+
+    def __call__(self, log: dict) -> None:
+        tool = log.get("tool")
+        spawn_details = None
+        if tool == "spawn_agent":
+            args = log.get("arguments") or _EMPTY_ARGS
+            spawn_details = (args.get("role") or "N/A", (args.get("task") or "N/A")[:80])
+        self.entries.append((log.get("type"), tool, log.get("step"), spawn_details))
+
+
+@lru_cache(maxsize=1)
+def _get_llm_client() -> LLMClient:
+    """LLM client shared by both tasks and all their sub-agents."""
+    return LLMClient(
+        api_key=settings.LLM_API_KEY,
+        api_base=settings.LLM_API_BASE,
+        model=settings.LLM_MODEL,
+    )
 
 
 async def run_real_task():
@@ -44,24 +85,22 @@ async def run_real_task():
         print("ERROR: LLM_API_KEY not set")
         return False
 
-    # Target file to analyze
-    target_file = Path(__file__).parent.parent.parent / "src/fastapi_agent/tools/spawn_agent_tool.py"
-    if not target_file.exists():
+    # Target file to analyze (a single stat covers both the existence check and the size)
+    target_file = _SPAWN_TOOL_FILE
+    try:
+        file_size = target_file.stat().st_size
+    except FileNotFoundError:
         print(f"ERROR: Target file not found: {target_file}")
         return False
 
     print(f"\nTarget file: {target_file}")
-    print(f"File size: {target_file.stat().st_size} bytes")
+    print(f"File size: {file_size} bytes")
 
     # Create LLM client
-    llm_client = LLMClient(
-        api_key=settings.LLM_API_KEY,
-        api_base=settings.LLM_API_BASE,
-        model=settings.LLM_MODEL,
-    )
+    llm_client = _get_llm_client()
 
     # Create tools
-    workspace_dir = str(target_file.parent.parent.parent.parent)
+    workspace_dir = _WORKSPACE
     read_tool = ReadTool(workspace_dir=workspace_dir)
 
     parent_tools = {"read_file": read_tool}
@@ -91,9 +130,10 @@ async def run_real_task():
 {target_file}
 
 要求：
-1. 派遣一个 security_auditor 角色的子Agent检查安全问题
-2. 派遣一个 code_reviewer 角色的子Agent检查代码风格
-3. 综合两个子Agent的分析结果，生成一份简洁的代码质量报告
+1. 请在同一回合内并行派遣两个子Agent：
+   - 一个 security_auditor 角色的子Agent检查安全问题
+   - 一个 code_reviewer 角色的子Agent检查代码风格
+2. 综合两个子Agent的分析结果，生成一份简洁的代码质量报告
 
 注意：每个子Agent需要先用 read_file 工具读取文件内容，然后进行分析。"""
 
@@ -107,30 +147,44 @@ async def run_real_task():
     print("\nExecuting...")
     print("-" * 70)
 
-    result, logs = await agent.run()
+    summary = _LogSummary()
+    result, _ = await agent.run(log_sink=summary)
 
     # Analyze execution
     print("\n" + "=" * 70)
     print("Execution Analysis")
     print("=" * 70)
 
-    steps = [l for l in logs if l.get("type") == "step"]
-    tool_calls = [l for l in logs if l.get("type") == "tool_call"]
-    spawn_calls = [l for l in tool_calls if l.get("tool") == "spawn_agent"]
-    read_calls = [l for l in tool_calls if l.get("tool") == "read_file"]
-
-    print(f"Total steps: {len(steps)}")
-    print(f"Tool calls: {len(tool_calls)}")
-    print(f"  - spawn_agent: {len(spawn_calls)}")
-    print(f"  - read_file: {len(read_calls)}")
+    # Count logs in a single pass; only spawn calls are kept for the details below
+    step_count = tool_call_count = read_count = 0
+    spawn_calls = []
+    for entry in summary.entries:
+        log_type, tool = entry[0], entry[1]
+        if log_type == "step":
+            step_count += 1
+        elif log_type == "tool_call":
+            tool_call_count += 1
+            if tool == "spawn_agent":
+                spawn_calls.append(entry)
+            elif tool == "read_file":
+                read_count += 1
+    spawn_count = len(spawn_calls)
+
+    print(f"Total steps: {step_count}")
+    print(f"Tool calls: {tool_call_count}")
+    print(f"  - spawn_agent: {spawn_count}")
+    print(f"  - read_file: {read_count}")
+
+    # Adjacent spawns issued in one turn run concurrently (Agent._run_spawn_batch)
+    spawn_steps = {step for _, _, step, _ in spawn_calls}
+    parallel = spawn_count >= 2 and len(spawn_steps) == 1
+    print(f"  - spawn_agent calls in one step (parallel): {parallel}")
 
     # Show spawn_agent calls details
     if spawn_calls:
         print("\nSpawn Agent Calls:")
-        for i, call in enumerate(spawn_calls, 1):
-            args = call.get("arguments", {})
-            print(f"  {i}. Role: {args.get('role', 'N/A')}")
-            print(f"     Task: {args.get('task', 'N/A')[:80]}...")
+        for i, (_, _, _, (role, task_preview)) in enumerate(spawn_calls, 1):
+            print(f"  {i}. Role: {role}\n     Task: {task_preview}...")
 
     print("\n" + "=" * 70)
     print("Final Report")
@@ -138,14 +192,16 @@ async def run_real_task():
     print(result)
 
     # Determine success
-    success = len(spawn_calls) >= 2
+    success = spawn_count >= 2
+    if success and not parallel:
+        print("\n⚠️  spawn_agent calls were spread over several steps and ran sequentially")
     if success:
         print("\n" + "=" * 70)
         print("✅ SUCCESS: Agent correctly used spawn_agent for multi-perspective analysis")
         print("=" * 70)
     else:
         print("\n" + "=" * 70)
-        print(f"⚠️  Agent used {len(spawn_calls)} spawn_agent calls (expected >= 2)")
+        print(f"⚠️  Agent used {spawn_count} spawn_agent calls (expected >= 2)")
         print("=" * 70)
 
     return success
@@ -161,15 +217,11 @@ async def run_simple_task():
         print("ERROR: LLM_API_KEY not set")
         return False
 
-    target_file = Path(__file__).parent.parent.parent / "src/fastapi_agent/tools/base.py"
+    target_file = _BASE_TOOL_FILE
 
-    llm_client = LLMClient(
-        api_key=settings.LLM_API_KEY,
-        api_base=settings.LLM_API_BASE,
-        model=settings.LLM_MODEL,
-    )
+    llm_client = _get_llm_client()
 
-    workspace_dir = str(target_file.parent.parent.parent.parent)
+    workspace_dir = _WORKSPACE
     read_tool = ReadTool(workspace_dir=workspace_dir)
 
     spawn_tool = SpawnAgentTool(
@@ -198,14 +250,15 @@ async def run_simple_task():
     print("-" * 70)
 
     agent.add_user_message(task)
-    result, logs = await agent.run()
+    summary = _LogSummary()
+    result, _ = await agent.run(log_sink=summary)
 
-    spawn_calls = [l for l in logs if l.get("type") == "tool_call" and l.get("tool") == "spawn_agent"]
+    spawn_count = sum(1 for e in summary.entries if e[0] == "tool_call" and e[1] == "spawn_agent")
 
-    print(f"\nSpawn calls: {len(spawn_calls)}")
+    print(f"\nSpawn calls: {spawn_count}")
     print(f"\nResult:\n{result[:500]}...")
 
-    success = len(spawn_calls) >= 1
+    success = spawn_count >= 1
     print(f"\n{'✅ SUCCESS' if success else '❌ FAILED'}")
     return success
 
@@ -3,7 +3,9 @@
 import asyncio
 import os
 import sys
-from typing import Any, Dict, List
+from collections import deque
+from types import MappingProxyType
+from typing import List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 try:
@@ -17,77 +19,90 @@ except ImportError:
             def asyncio(func):
                 return func
 
+        @staticmethod
+        def fixture(*args, **kwargs):
+            return lambda func: func
+
 from fastapi_agent.core.agent import Agent
 from fastapi_agent.core.config import settings
 from fastapi_agent.core.llm_client import LLMClient
 from fastapi_agent.schemas.message import AgentConfig, LLMResponse, ToolCall, FunctionCall
 from fastapi_agent.tools.base import Tool, ToolResult
-from fastapi_agent.tools.spawn_agent_tool import SpawnAgentTool
+from fastapi_agent.tools.spawn_agent_tool import AgentPool, SpawnAgentTool
 from fastapi_agent.tools.file_tools import ReadTool
 from fastapi_agent.api.deps import AgentFactory
 
 
 class MockReadTool(Tool):
-    @property
-    def name(self) -> str:
-        return "read_file"
-
-    @property
-    def description(self) -> str:
-        return "Read file content"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {"path": {"type": "string"}},
-            "required": ["path"]
-        }
+    # Class attributes shadow Tool's properties; the schema is built once and read-only
+    name = "read_file"
+    description = "Read file content"
+    parameters = MappingProxyType({
+        "type": "object",
+        "properties": {"path": {"type": "string"}},
+        "required": ["path"]
+    })
 
     async def execute(self, path: str, **kwargs) -> ToolResult:
         return ToolResult(success=True, content=f"Content of {path}: mock file content")
 
 
 class MockWriteTool(Tool):
-    @property
-    def name(self) -> str:
-        return "write_file"
-
-    @property
-    def description(self) -> str:
-        return "Write file content"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "path": {"type": "string"},
-                "content": {"type": "string"}
-            },
-            "required": ["path", "content"]
-        }
+    name = "write_file"
+    description = "Write file content"
+    parameters = MappingProxyType({
+        "type": "object",
+        "properties": {
+            "path": {"type": "string"},
+            "content": {"type": "string"}
+        },
+        "required": ["path", "content"]
+    })
 
     async def execute(self, path: str, content: str, **kwargs) -> ToolResult:
         return ToolResult(success=True, content=f"Written to {path}")
 
 
+def _llm_mock() -> MagicMock:
+    """A MagicMock restricted to LLMClient's attributes."""
+    return MagicMock(spec_set=LLMClient)
+
+
+@pytest.fixture
+def mock_llm():
+    return _llm_mock()
+
+
+# The mock tools are stateless, so one instance of each serves the whole session
+@pytest.fixture(scope="session")
+def read_only_tools():
+    return MappingProxyType({"read_file": MockReadTool()})
+
+
+@pytest.fixture(scope="session")
+def parent_tools():
+    return MappingProxyType({"read_file": MockReadTool(), "write_file": MockWriteTool()})
+
+
 def create_mock_llm_client(responses: List[LLMResponse] = None):
     """Create a mock LLM client with predefined responses."""
-    mock_client = MagicMock(spec=LLMClient)
+    mock_client = _llm_mock()
 
     if responses is None:
         responses = [
             LLMResponse(content="Task completed successfully.", tool_calls=None)
         ]
 
-    response_iter = iter(responses)
+    responses_list = list(responses)
+    fallback = LLMResponse(content="No more responses", tool_calls=None)
+    idx = [0]
 
     async def mock_generate(*args, **kwargs):
-        try:
-            return next(response_iter)
-        except StopIteration:
-            return LLMResponse(content="No more responses", tool_calls=None)
+        i = idx[0]
+        if i >= len(responses_list):
+            return fallback
+        idx[0] = i + 1
+        return responses_list[i]
 
     mock_client.generate = mock_generate
     return mock_client
@@ -96,9 +111,8 @@ def create_mock_llm_client(responses: List[LLMResponse] = None):
 class TestSpawnAgentToolBasic:
     """Basic SpawnAgentTool tests."""
 
-    def test_tool_properties(self):
+    def test_tool_properties(self, mock_llm):
         """Test SpawnAgentTool has correct properties."""
-        mock_llm = MagicMock()
         tool = SpawnAgentTool(
             llm_client=mock_llm,
             parent_tools={},
@@ -117,10 +131,20 @@ class TestSpawnAgentToolBasic:
         assert tool.add_instructions_to_prompt is True
         assert tool.instructions is not None
 
-    def test_depth_tracking(self):
-        """Test depth is correctly tracked."""
-        mock_llm = MagicMock()
+    def test_schema_properties_are_memoized(self, mock_llm):
+        """Test that rendered schema properties are built once per tool."""
+        tool = SpawnAgentTool(
+            llm_client=mock_llm,
+            parent_tools={},
+            workspace_dir="/tmp/test",
+        )
+
+        assert tool.description is tool.description
+        assert tool.parameters is tool.parameters
+        assert tool.to_schema()["input_schema"] is tool.parameters
 
+    def test_depth_tracking(self, mock_llm):
+        """Test depth is correctly tracked."""
         tool_d0 = SpawnAgentTool(
             llm_client=mock_llm,
             parent_tools={},
@@ -146,10 +170,8 @@ class TestSpawnAgentToolDepthLimit:
     """Test recursive depth limiting."""
 
     @pytest.mark.asyncio
-    async def test_depth_limit_blocks_spawn(self):
+    async def test_depth_limit_blocks_spawn(self, mock_llm):
         """Test that spawning is blocked at max depth."""
-        mock_llm = MagicMock()
-
         tool = SpawnAgentTool(
             llm_client=mock_llm,
             parent_tools={},
@@ -165,7 +187,23 @@ class TestSpawnAgentToolDepthLimit:
         assert "(3)" in result.error
 
     @pytest.mark.asyncio
-    async def test_depth_limit_allows_spawn_below_max(self):
+    async def test_depth_limit_short_circuits_execute_many(self, mock_llm):
+        """Test that batched spawns at max depth are rejected without running."""
+        tool = SpawnAgentTool(
+            llm_client=mock_llm,
+            parent_tools={},
+            workspace_dir="/tmp/test",
+            current_depth=3,
+            max_depth=3
+        )
+
+        results = await tool.execute_many([{"task": "a"}, {"task": "b"}])
+
+        assert [r.success for r in results] == [False, False]
+        assert "Maximum agent nesting depth" in results[1].error
+
+    @pytest.mark.asyncio
+    async def test_depth_limit_allows_spawn_below_max(self, read_only_tools):
         """Test that spawning is allowed below max depth."""
         responses = [
             LLMResponse(content="Sub-agent completed the task.", tool_calls=None)
@@ -174,7 +212,7 @@ class TestSpawnAgentToolDepthLimit:
 
         tool = SpawnAgentTool(
             llm_client=mock_llm,
-            parent_tools={"read_file": MockReadTool()},
+            parent_tools=read_only_tools,
             workspace_dir="/tmp/test",
             current_depth=1,
             max_depth=3
@@ -189,13 +227,8 @@ class TestSpawnAgentToolDepthLimit:
 class TestSpawnAgentToolInheritance:
     """Test tool inheritance behavior."""
 
-    def test_inherit_all_tools(self):
+    def test_inherit_all_tools(self, mock_llm, parent_tools):
         """Test that sub-agent inherits all parent tools by default."""
-        mock_llm = MagicMock()
-        parent_tools = {
-            "read_file": MockReadTool(),
-            "write_file": MockWriteTool(),
-        }
 
         tool = SpawnAgentTool(
             llm_client=mock_llm,
@@ -211,13 +244,8 @@ class TestSpawnAgentToolInheritance:
         assert "read_file" in sub_tool_names
         assert "write_file" in sub_tool_names
 
-    def test_filter_specific_tools(self):
+    def test_filter_specific_tools(self, mock_llm, parent_tools):
         """Test filtering to specific tools."""
-        mock_llm = MagicMock()
-        parent_tools = {
-            "read_file": MockReadTool(),
-            "write_file": MockWriteTool(),
-        }
 
         tool = SpawnAgentTool(
             llm_client=mock_llm,
@@ -233,10 +261,8 @@ class TestSpawnAgentToolInheritance:
         assert "read_file" in sub_tool_names
         assert "write_file" not in sub_tool_names
 
-    def test_spawn_agent_depth_increment(self):
+    def test_spawn_agent_depth_increment(self, mock_llm, read_only_tools):
         """Test that inherited spawn_agent has incremented depth."""
-        mock_llm = MagicMock()
-
         parent_spawn = SpawnAgentTool(
             llm_client=mock_llm,
             parent_tools={},
@@ -247,7 +273,7 @@ class TestSpawnAgentToolInheritance:
 
         parent_tools = {
             "spawn_agent": parent_spawn,
-            "read_file": MockReadTool(),
+            **read_only_tools,
         }
 
         tool = SpawnAgentTool(
@@ -264,10 +290,12 @@ class TestSpawnAgentToolInheritance:
         assert len(spawn_tools) == 1
         assert spawn_tools[0]._current_depth == 1
 
-    def test_spawn_agent_excluded_at_max_depth(self):
-        """Test that spawn_agent is excluded when at max depth - 1."""
-        mock_llm = MagicMock()
+        # The inherited tool tuple (and nested spawn tool) is built once
+        assert isinstance(sub_tools, tuple)
+        assert tool._build_sub_agent_tools(None) is sub_tools
 
+    def test_spawn_agent_excluded_at_max_depth(self, mock_llm, read_only_tools):
+        """Test that spawn_agent is excluded when at max depth - 1."""
         parent_spawn = SpawnAgentTool(
             llm_client=mock_llm,
             parent_tools={},
@@ -278,7 +306,7 @@ class TestSpawnAgentToolInheritance:
 
         parent_tools = {
             "spawn_agent": parent_spawn,
-            "read_file": MockReadTool(),
+            **read_only_tools,
         }
 
         tool = SpawnAgentTool(
@@ -293,14 +321,17 @@ class TestSpawnAgentToolInheritance:
         spawn_tools = [t for t in sub_tools if t.name == "spawn_agent"]
 
         assert len(spawn_tools) == 0  # spawn_agent should not be included
+        # No nested SpawnAgentTool is built for a sub-agent that couldn't use it
+        assert tool._child_spawn_tool is None
+        # Explicitly requested spawn_agent is dropped as well
+        assert [t.name for t in tool._build_sub_agent_tools(["spawn_agent", "read_file"])] == ["read_file"]
 
 
 class TestSpawnAgentToolSystemPrompt:
     """Test system prompt building."""
 
-    def test_prompt_with_role(self):
+    def test_prompt_with_role(self, mock_llm):
         """Test prompt includes role when specified."""
-        mock_llm = MagicMock()
         tool = SpawnAgentTool(
             llm_client=mock_llm,
             parent_tools={},
@@ -309,14 +340,13 @@ class TestSpawnAgentToolSystemPrompt:
             max_depth=3
         )
 
-        prompt = tool._build_sub_agent_prompt(role="security auditor", context=None)
+        prompt = "".join(block["text"] for block in tool._build_sub_agent_prompt_blocks(role="security auditor", context=None))
 
         assert "security auditor" in prompt
         assert "specialized" in prompt.lower()
 
-    def test_prompt_with_context(self):
+    def test_prompt_with_context(self, mock_llm):
         """Test prompt includes context when provided."""
-        mock_llm = MagicMock()
         tool = SpawnAgentTool(
             llm_client=mock_llm,
             parent_tools={},
@@ -326,14 +356,13 @@ class TestSpawnAgentToolSystemPrompt:
         )
 
         context = "This is a FastAPI project using SQLAlchemy"
-        prompt = tool._build_sub_agent_prompt(role=None, context=context)
+        prompt = "".join(block["text"] for block in tool._build_sub_agent_prompt_blocks(role=None, context=context))
 
         assert context in prompt
         assert "Context from Parent" in prompt
 
-    def test_prompt_includes_workspace(self):
+    def test_prompt_includes_workspace(self, mock_llm):
         """Test prompt includes workspace directory."""
-        mock_llm = MagicMock()
         tool = SpawnAgentTool(
             llm_client=mock_llm,
             parent_tools={},
@@ -342,16 +371,52 @@ class TestSpawnAgentToolSystemPrompt:
             max_depth=3
         )
 
-        prompt = tool._build_sub_agent_prompt(role=None, context=None)
+        prompt = "".join(block["text"] for block in tool._build_sub_agent_prompt_blocks(role=None, context=None))
 
         assert "/custom/workspace" in prompt
 
+    def test_prompt_blocks_cache_static_prefix(self, mock_llm):
+        """Test that static blocks are cacheable and parent context is not."""
+        tool = SpawnAgentTool(
+            llm_client=mock_llm,
+            parent_tools={},
+            workspace_dir="/tmp/test",
+            current_depth=0,
+            max_depth=3
+        )
+
+        blocks = tool._build_sub_agent_prompt_blocks(role="test writer", context="Use pytest")
+        other = tool._build_sub_agent_prompt_blocks(role="reviewer", context="Check style")
+
+        assert [b.get("cache_control") for b in blocks] == [
+            {"type": "ephemeral"},
+            {"type": "ephemeral"},
+            None,
+        ]
+        # Static prefix is identical across siblings
+        assert blocks[0] == other[0]
+        assert "/tmp/test" in blocks[0]["text"]
+        assert "test writer" in blocks[1]["text"]
+        assert "Use pytest" in blocks[2]["text"]
+
+    def test_prompt_blocks_without_context(self, mock_llm):
+        """Test that no uncached block is emitted without parent context."""
+        tool = SpawnAgentTool(
+            llm_client=mock_llm,
+            parent_tools={},
+            workspace_dir="/tmp/test",
+        )
+
+        blocks = tool._build_sub_agent_prompt_blocks(role=None, context=None)
+
+        assert len(blocks) == 2
+
 
 class TestSpawnAgentToolExecution:
     """Test actual execution flow."""
 
     @pytest.mark.asyncio
-    async def test_successful_execution(self):
+    async def test_successful_execution(self, read_only_tools):
         """Test successful sub-agent execution."""
         responses = [
             LLMResponse(
@@ -363,7 +428,7 @@ class TestSpawnAgentToolExecution:
 
         tool = SpawnAgentTool(
             llm_client=mock_llm,
-            parent_tools={"read_file": MockReadTool()},
+            parent_tools=read_only_tools,
             workspace_dir="/tmp/test",
             current_depth=0,
             max_depth=3,
@@ -382,7 +447,7 @@ class TestSpawnAgentToolExecution:
         assert "analyzed the code" in result.content
 
     @pytest.mark.asyncio
-    async def test_execution_with_tool_usage(self):
+    async def test_execution_with_tool_usage(self, read_only_tools):
         """Test sub-agent that uses tools."""
         responses = [
             LLMResponse(
@@ -407,7 +472,7 @@ class TestSpawnAgentToolExecution:
 
         tool = SpawnAgentTool(
             llm_client=mock_llm,
-            parent_tools={"read_file": MockReadTool()},
+            parent_tools=read_only_tools,
             workspace_dir="/tmp/test",
             current_depth=0,
             max_depth=3
@@ -420,6 +485,56 @@ class TestSpawnAgentToolExecution:
 
         assert result.success is True
         assert "File analyzed" in result.content
+        assert "2/15 steps, 1 tool calls" in result.content
+
+    @pytest.mark.asyncio
+    async def test_agent_run_log_sink(self):
+        """Test that a log sink receives entries instead of the returned list."""
+        agent = Agent(
+            llm_client=create_mock_llm_client(),
+            system_prompt="You are a helpful assistant.",
+            workspace_dir="/tmp/test",
+            enable_logging=False,
+        )
+        agent.add_user_message("hi")
+        entries = []
+
+        result, logs = await agent.run(log_sink=entries.append)
+
+        assert result == "Task completed successfully."
+        assert logs == []
+        assert [e["type"] for e in entries] == ["step", "llm_response", "completion"]
+
+    @pytest.mark.asyncio
+    async def test_agent_run_stop_condition(self, read_only_tools):
+        """Test that a matching stop condition ends the run after the current step's tools."""
+        read_call = LLMResponse(
+            content="",
+            tool_calls=[
+                ToolCall(
+                    id="call_read",
+                    type="function",
+                    function=FunctionCall(name="read_file", arguments={"path": "/src/main.py"}),
+                )
+            ],
+        )
+        agent = Agent(
+            llm_client=create_mock_llm_client([read_call, LLMResponse(content="Never reached.")]),
+            system_prompt="You are a helpful assistant.",
+            tools=[read_only_tools["read_file"]],
+            workspace_dir="/tmp/test",
+            enable_logging=False,
+        )
+        agent.add_user_message("Read main.py")
+
+        result, logs = await agent.run(
+            stop_condition=lambda e: e.get("type") == "tool_call" and e.get("tool") == "read_file"
+        )
+
+        assert result == "Run stopped by stop condition at step 1."
+        assert [e["type"] for e in logs] == ["step", "llm_response", "tool_call", "tool_result", "stopped"]
+        # The tool result is recorded before stopping, so the history stays consistent
+        assert agent.messages[-1].role == "tool"
 
     @pytest.mark.asyncio
     async def test_max_steps_respected(self):
@@ -446,67 +561,413 @@ class TestSpawnAgentToolExecution:
         assert "steps" in result.content.lower()
 
 
-class TestAgentFactoryIntegration:
-    """Test integration with AgentFactory."""
+class TestSpawnAgentPromptCacheKey:
+    """Test prompt cache key propagation to sub-agents."""
+
+    @staticmethod
+    def create_recording_llm_client(keys: List[str]):
+        """Create a mock LLM client that records the prompt_cache_key of each call."""
+        mock_llm = _llm_mock()
+
+        async def mock_generate(*args, **kwargs):
+            keys.append(kwargs.get("prompt_cache_key"))
+            return LLMResponse(content="Done", tool_calls=None)
+
+        mock_llm.generate = mock_generate
+        return mock_llm
 
     @pytest.mark.asyncio
-    async def test_factory_adds_spawn_agent_tool(self):
-        """Test that AgentFactory adds SpawnAgentTool when enabled."""
-        factory = AgentFactory(settings)
-        mock_llm = MagicMock(spec=LLMClient)
+    async def test_siblings_share_derived_key(self, read_only_tools):
+        """Test that sibling sub-agents with the same tools share one key."""
+        keys = []
+        tool = SpawnAgentTool(
+            llm_client=self.create_recording_llm_client(keys),
+            parent_tools=read_only_tools,
+            workspace_dir="/tmp/test",
+        )
 
-        config = AgentConfig(
-            enable_spawn_agent=True,
-            enable_base_tools=True,
-            enable_mcp_tools=False,
-            enable_skills=False,
-            enable_rag=False,
-            base_tools_filter=["read_file"]
+        await tool.execute(task="first", role="auditor", context="a")
+        await tool.execute(task="second", role="reviewer", context="b")
+        await tool.execute(task="third", tools=[])
+
+        assert keys[0] is not None
+        assert keys[0] == keys[1]
+        assert keys[2] != keys[0]
+
+    @pytest.mark.asyncio
+    async def test_parent_key_is_propagated(self, read_only_tools):
+        """Test that an explicit parent key is used for every sub-agent."""
+        keys = []
+        tool = SpawnAgentTool(
+            llm_client=self.create_recording_llm_client(keys),
+            parent_tools=read_only_tools,
+            workspace_dir="/tmp/test",
+            parent_prompt_cache_key="parent-key",
         )
 
-        agent = await factory.create_agent(mock_llm, config)
+        await tool.execute(task="first")
+        await tool.execute(task="second", tools=[])
+
+        assert keys == ["parent-key", "parent-key"]
+
+
+class TestSpawnAgentResultCache:
+    """Test caching of read-only sub-agent results."""
+
+    @staticmethod
+    def create_counting_llm_client(calls: List[int]):
+        mock_llm = _llm_mock()
 
-        tool_names = list(agent.tools.keys())
-        assert "spawn_agent" in tool_names
+        async def mock_generate(*args, **kwargs):
+            calls[0] += 1
+            return LLMResponse(content=f"analysis #{calls[0]}", tool_calls=None)
+
+        mock_llm.generate = mock_generate
+        return mock_llm
 
     @pytest.mark.asyncio
-    async def test_factory_respects_disable_spawn_agent(self):
-        """Test that SpawnAgentTool is not added when disabled."""
-        factory = AgentFactory(settings)
-        mock_llm = MagicMock(spec=LLMClient)
+    async def test_read_only_run_is_cached(self, read_only_tools):
+        """Test that repeating a read-only spawn returns the cached result."""
+        calls = [0]
+        tool = SpawnAgentTool(
+            llm_client=self.create_counting_llm_client(calls),
+            parent_tools=read_only_tools,
+            workspace_dir="/tmp/test",
+            result_cache_size=8,
+        )
 
-        config = AgentConfig(
-            enable_spawn_agent=False,
-            enable_base_tools=True,
-            enable_mcp_tools=False,
-            enable_skills=False,
-            enable_rag=False,
-            base_tools_filter=["read_file"]
+        first = await tool.execute(task="audit /src/auth", role="auditor", tools=["read_file"])
+        second = await tool.execute(task="audit /src/auth", role="auditor", tools=["read_file"])
+        other = await tool.execute(task="audit /src/api", role="auditor", tools=["read_file"])
+
+        assert calls[0] == 2
+        assert second.content == first.content
+        assert "analysis #2" in other.content
+
+    @pytest.mark.asyncio
+    async def test_side_effect_tools_are_not_cached(self, parent_tools):
+        """Test that spawns with write-capable tools always run."""
+        calls = [0]
+        tool = SpawnAgentTool(
+            llm_client=self.create_counting_llm_client(calls),
+            parent_tools=parent_tools,
+            workspace_dir="/tmp/test",
+            result_cache_size=8,
         )
 
-        agent = await factory.create_agent(mock_llm, config)
+        await tool.execute(task="fix the bug", tools=["read_file", "write_file"])
+        await tool.execute(task="fix the bug", tools=["read_file", "write_file"])
 
-        tool_names = list(agent.tools.keys())
-        assert "spawn_agent" not in tool_names
+        assert calls[0] == 2
 
     @pytest.mark.asyncio
-    async def test_factory_respects_max_depth_config(self):
-        """Test that AgentFactory respects spawn_agent_max_depth config."""
-        factory = AgentFactory(settings)
-        mock_llm = MagicMock(spec=LLMClient)
+    async def test_cache_is_disabled_by_default(self, read_only_tools):
+        """Test that read-only spawns always run unless the cache is enabled."""
+        calls = [0]
+        tool = SpawnAgentTool(
+            llm_client=self.create_counting_llm_client(calls),
+            parent_tools=read_only_tools,
+            workspace_dir="/tmp/test",
+        )
 
-        config = AgentConfig(
-            enable_spawn_agent=True,
-            spawn_agent_max_depth=2,
-            enable_base_tools=False,
-            enable_mcp_tools=False,
-            enable_skills=False,
-            enable_rag=False
+        await tool.execute(task="audit /src/auth", tools=["read_file"])
+        await tool.execute(task="audit /src/auth", tools=["read_file"])
+
+        assert calls[0] == 2
+
+
+class TestAgentPool:
+    """Test pooling of sub-agent instances."""
+
+    def test_checkout_miss_uses_factory(self):
+        """Test that an empty pool builds a new agent."""
+        pool = AgentPool()
+        agent = MagicMock()
+
+        assert pool.checkout("key", lambda: agent) is agent
+        agent.reset_conversation.assert_not_called()
+
+    def test_return_resets_and_checkout_reuses(self):
+        """Test that a returned agent is reset and then reused."""
+        pool = AgentPool()
+        agent = MagicMock()
+        pool.return_("key", agent)
+
+        agent.reset_conversation.assert_called_once()
+        assert pool.checkout("key", MagicMock) is agent
+        # Checked-out agents leave the pool
+        assert pool.checkout("key", lambda: "new") == "new"
+
+    def test_lru_eviction(self):
+        """Test that the least recently returned agent is evicted."""
+        pool = AgentPool(maxsize=2)
+        agents = {key: MagicMock() for key in "abc"}
+        for key, agent in agents.items():
+            pool.return_(key, agent)
+
+        assert pool.checkout("a", lambda: "new") == "new"
+        assert pool.checkout("c", lambda: "new") is agents["c"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_spawn_reuses_agent(self, read_only_tools):
+        """Test that identical spawns reuse one sub-agent without leaking history."""
+        mock_llm = create_mock_llm_client([
+            LLMResponse(content="first result", tool_calls=None),
+            LLMResponse(content="second result", tool_calls=None),
+        ])
+        tool = SpawnAgentTool(
+            llm_client=mock_llm,
+            parent_tools=read_only_tools,
+            workspace_dir="/tmp/test",
+        )
+
+        first = await tool.execute(task="first task", role="auditor", tools=["read_file"])
+        pooled = list(tool._agent_pool._idle.values())
+        second = await tool.execute(task="second task", role="auditor", tools=["read_file"])
+
+        assert "first result" in first.content
+        assert "second result" in second.content
+        assert len(pooled) == 1
+        assert list(tool._agent_pool._idle.values()) == pooled
+        # Idle agents do not retain the finished run's history
+        assert [m.role for m in pooled[0].messages] == ["system"]
+        assert pooled[0].execution_logs == []
+
+    def test_pool_is_per_tool(self, mock_llm, read_only_tools):
+        """Test that each spawn tool owns its pool, so it ends with the parent run."""
+        first = SpawnAgentTool(llm_client=mock_llm, parent_tools=read_only_tools, workspace_dir="/tmp/test")
+        second = SpawnAgentTool(llm_client=mock_llm, parent_tools=read_only_tools, workspace_dir="/tmp/test")
+
+        assert first._agent_pool is not second._agent_pool
+
+
+class TestSpawnAgentParallelExecution:
+    """Test concurrent execution of sibling sub-agents."""
+
+    @staticmethod
+    def create_slow_llm_client(active: List[int], peak: List[int]):
+        """Create a mock LLM client that records peak concurrent calls."""
+        mock_llm = _llm_mock()
+
+        async def mock_generate(*args, **kwargs):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.05)
+            active[0] -= 1
+            return LLMResponse(content="Sub-task done.", tool_calls=None)
+
+        mock_llm.generate = mock_generate
+        return mock_llm
+
+    @pytest.mark.asyncio
+    async def test_execute_many_runs_concurrently(self):
+        """Test that execute_many overlaps sub-agents and keeps result order."""
+        active, peak = [0], [0]
+        tool = SpawnAgentTool(
+            llm_client=self.create_slow_llm_client(active, peak),
+            parent_tools={},
+            workspace_dir="/tmp/test",
+            max_parallel=4,
+        )
+
+        results = await tool.execute_many([
+            {"task": "task one", "role": "first"},
+            {"task": "task two", "role": "second"},
+            {"task": "task three", "role": "third"},
+        ])
+
+        assert [r.success for r in results] == [True, True, True]
+        assert "(first)" in results[0].content
+        assert "(third)" in results[2].content
+        assert peak[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_many_respects_max_parallel(self):
+        """Test that concurrency is capped at max_parallel."""
+        active, peak = [0], [0]
+        tool = SpawnAgentTool(
+            llm_client=self.create_slow_llm_client(active, peak),
+            parent_tools={},
+            workspace_dir="/tmp/test",
+            max_parallel=2,
         )
 
-        agent = await factory.create_agent(mock_llm, config)
+        results = await tool.execute_many([{"task": f"task {i}"} for i in range(5)])
+
+        assert len(results) == 5
+        assert peak[0] == 2
 
-        spawn_tool = agent.tools.get("spawn_agent")
+    @pytest.mark.asyncio
+    async def test_execute_many_invalid_arguments(self):
+        """Test that a malformed call fails alone without sinking its siblings."""
+        tool = SpawnAgentTool(
+            llm_client=create_mock_llm_client(),
+            parent_tools={},
+            workspace_dir="/tmp/test",
+        )
+
+        results = await tool.execute_many([{"task": "ok"}, {"role": "missing task"}])
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "Sub-agent execution failed" in results[1].error
+
+    @pytest.mark.asyncio
+    async def test_execute_many_propagates_cancellation(self):
+        """Test that a cancelled sub-agent is not turned into a failed result."""
+        tool = SpawnAgentTool(
+            llm_client=create_mock_llm_client(),
+            parent_tools={},
+            workspace_dir="/tmp/test",
+        )
+
+        async def cancelled_execute(**kwargs):
+            raise asyncio.CancelledError()
+
+        tool.execute = cancelled_execute
+
+        with pytest.raises(asyncio.CancelledError):
+            await tool.execute_many([{"task": "a"}, {"task": "b"}])
+
+    @pytest.mark.asyncio
+    async def test_agent_dispatches_sibling_spawns_together(self):
+        """Test that the agent loop runs sibling spawn_agent calls concurrently."""
+        spawn_tool = SpawnAgentTool(
+            llm_client=create_mock_llm_client(),
+            parent_tools={},
+            workspace_dir="/tmp/test",
+        )
+        batches = []
+
+        async def fake_execute_many_timed(calls):
+            batches.append(calls)
+            return [(ToolResult(success=True, content=f"result {c['task']}"), 0.0) for c in calls]
+
+        spawn_tool.execute_many_timed = fake_execute_many_timed
+
+        main_llm = create_mock_llm_client([
+            LLMResponse(
+                content="",
+                tool_calls=[
+                    ToolCall(
+                        id=f"call_{i}",
+                        type="function",
+                        function=FunctionCall(name="spawn_agent", arguments={"task": f"t{i}"}),
+                    )
+                    for i in range(3)
+                ],
+            ),
+            LLMResponse(content="All done.", tool_calls=None),
+        ])
+
+        agent = Agent(
+            llm_client=main_llm,
+            system_prompt="You are a helpful assistant.",
+            tools=[spawn_tool],
+            max_steps=5,
+            workspace_dir="/tmp/test",
+            enable_logging=False,
+        )
+        agent.add_user_message("Split this up")
+        result, logs = await agent.run()
+
+        assert result == "All done."
+        assert batches == [[{"task": "t0"}, {"task": "t1"}, {"task": "t2"}]]
+        tool_messages = [m for m in agent.messages if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_messages] == ["call_0", "call_1", "call_2"]
+        assert [m.content for m in tool_messages] == ["result t0", "result t1", "result t2"]
+        # All three spawns are logged under the same step
+        assert {entry["step"] for entry in logs if entry.get("type") == "tool_call"} == {1}
+
+    @pytest.mark.asyncio
+    async def test_agent_batches_only_adjacent_spawns(self):
+        """Test that spawns keep their position relative to other tool calls."""
+        order = []
+
+        class RecordingWriteTool(MockWriteTool):
+            async def execute(self, path: str, content: str, **kwargs) -> ToolResult:
+                order.append(f"write {path}")
+                return ToolResult(success=True, content=f"Written to {path}")
+
+        spawn_tool = SpawnAgentTool(
+            llm_client=create_mock_llm_client(),
+            parent_tools={},
+            workspace_dir="/tmp/test",
+        )
+
+        async def fake_execute(task, **kwargs):
+            order.append(f"spawn {task}")
+            return ToolResult(success=True, content=f"result {task}")
+
+        async def fake_execute_many_timed(calls):
+            order.append(f"batch {[c['task'] for c in calls]}")
+            return [(ToolResult(success=True, content=f"result {c['task']}"), 0.0) for c in calls]
+
+        spawn_tool.execute = fake_execute
+        spawn_tool.execute_many_timed = fake_execute_many_timed
+
+        def call(call_id, name, arguments):
+            return ToolCall(id=call_id, type="function", function=FunctionCall(name=name, arguments=arguments))
+
+        main_llm = create_mock_llm_client([
+            LLMResponse(
+                content="",
+                tool_calls=[
+                    call("c0", "write_file", {"path": "a.py", "content": "x"}),
+                    call("c1", "spawn_agent", {"task": "review a.py"}),
+                    call("c2", "spawn_agent", {"task": "test a.py"}),
+                    call("c3", "write_file", {"path": "b.py", "content": "y"}),
+                    call("c4", "spawn_agent", {"task": "review b.py"}),
+                ],
+            ),
+            LLMResponse(content="All done.", tool_calls=None),
+        ])
+        agent = Agent(
+            llm_client=main_llm,
+            system_prompt="You are a helpful assistant.",
+            tools=[RecordingWriteTool(), spawn_tool],
+            max_steps=5,
+            workspace_dir="/tmp/test",
+            enable_logging=False,
+        )
+        agent.add_user_message("Write and review")
+        await agent.run()
+
+        assert order == [
+            "write a.py",
+            "batch ['review a.py', 'test a.py']",
+            "write b.py",
+            "spawn review b.py",
+        ]
+        tool_messages = [m for m in agent.messages if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_messages] == ["c0", "c1", "c2", "c3", "c4"]
+
+
+class TestAgentFactoryIntegration:
+    """Test integration with AgentFactory."""
+
+    @pytest.mark.asyncio
+    async def test_factory_spawn_agent_configs(self, mock_llm):
+        """Test that AgentFactory adds, omits and configures SpawnAgentTool per config."""
+        factory = AgentFactory(settings)
+        common = {"enable_mcp_tools": False, "enable_skills": False, "enable_rag": False}
+        configs = [
+            # Enabled: spawn_agent is added
+            AgentConfig(enable_spawn_agent=True, enable_base_tools=True, base_tools_filter=["read_file"], **common),
+            # Disabled: spawn_agent is not added
+            AgentConfig(enable_spawn_agent=False, enable_base_tools=True, base_tools_filter=["read_file"], **common),
+            # spawn_agent_max_depth is passed through
+            AgentConfig(enable_spawn_agent=True, spawn_agent_max_depth=2, enable_base_tools=False, **common),
+        ]
+
+        # The configs are independent, so the agents are built concurrently
+        enabled, disabled, depth_limited = await asyncio.gather(
+            *(factory.create_agent(mock_llm, config) for config in configs)
+        )
+
+        assert "spawn_agent" in enabled.tools
+        assert "spawn_agent" not in disabled.tools
+        spawn_tool = depth_limited.tools.get("spawn_agent")
         assert spawn_tool is not None
         assert spawn_tool._max_depth == 2
 
@@ -515,7 +976,7 @@ class TestEndToEndScenario:
     """End-to-end scenario tests."""
 
     @pytest.mark.asyncio
-    async def test_agent_spawns_subagent(self):
+    async def test_agent_spawns_subagent(self, read_only_tools):
         """Test complete flow: Agent decides to spawn sub-agent."""
         # Main agent decides to use spawn_agent
         main_responses = [
@@ -550,29 +1011,27 @@ class TestEndToEndScenario:
             )
         ]
 
-        # Create mock LLM that returns different responses
-        call_count = [0]
+        # Create mock LLM that returns different responses, repeating the last one
         all_responses = main_responses + sub_responses
+        queue = deque(all_responses)
+        fallback = all_responses[-1]
 
         async def mock_generate(*args, **kwargs):
-            idx = min(call_count[0], len(all_responses) - 1)
-            call_count[0] += 1
-            return all_responses[idx]
+            return queue.popleft() if queue else fallback
 
-        mock_llm = MagicMock(spec=LLMClient)
+        mock_llm = _llm_mock()
         mock_llm.generate = mock_generate
 
         # Create main agent with spawn_agent tool
-        parent_tools = {"read_file": MockReadTool()}
         spawn_tool = SpawnAgentTool(
             llm_client=mock_llm,
-            parent_tools=parent_tools,
+            parent_tools=read_only_tools,
             workspace_dir="/tmp/test",
             current_depth=0,
             max_depth=3
         )
 
-        all_tools = [MockReadTool(), spawn_tool]
+        all_tools = [read_only_tools["read_file"], spawn_tool]
 
         agent = Agent(
             llm_client=mock_llm,
@@ -590,9 +1049,7 @@ class TestEndToEndScenario:
         assert "secure" in result.lower() or "security" in result.lower()
 
         # Check that spawn_agent was called
-        tool_calls = [log for log in logs if log.get("type") == "tool_call"]
-        spawn_calls = [tc for tc in tool_calls if tc.get("tool") == "spawn_agent"]
-        assert len(spawn_calls) > 0
+        assert any(log.get("type") == "tool_call" and log.get("tool") == "spawn_agent" for log in logs)
 
 
 def run_quick_test():
@@ -603,7 +1060,7 @@ def run_quick_test():
 
     # Test 1: Basic properties
     print("\n[Test 1] Basic properties...")
-    mock_llm = MagicMock()
+    mock_llm = _llm_mock()
     tool = SpawnAgentTool(
         llm_client=mock_llm,
         parent_tools={},
@@ -617,8 +1074,6 @@ def run_quick_test():
     print("  ✅ Parameters include task")
 
     # Test 2: Depth limit
-    print("\n[Test 2] Depth limit...")
-
     async def test_depth():
         tool_at_max = SpawnAgentTool(
             llm_client=mock_llm,
@@ -630,9 +1085,7 @@ def run_quick_test():
         result = await tool_at_max.execute(task="test")
         assert result.success is False
         assert "Maximum" in result.error
-        print("  ✅ Depth limit enforced")
-
-    asyncio.run(test_depth())
+        print("  ✅ [Test 2] Depth limit enforced")
 
     # Test 3: Tool inheritance
     print("\n[Test 3] Tool inheritance...")
@@ -654,11 +1107,9 @@ def run_quick_test():
     print("  ✅ Tools inherited correctly")
 
     # Test 4: AgentFactory integration
-    print("\n[Test 4] AgentFactory integration...")
-
     async def test_factory():
         factory = AgentFactory(settings)
-        mock_llm_client = MagicMock(spec=LLMClient)
+        mock_llm_client = _llm_mock()
         config = AgentConfig(
             enable_spawn_agent=True,
             enable_base_tools=False,
@@ -668,13 +1119,9 @@ def run_quick_test():
         )
         agent = await factory.create_agent(mock_llm_client, config)
         assert "spawn_agent" in agent.tools
-        print("  ✅ AgentFactory adds spawn_agent")
-
-    asyncio.run(test_factory())
+        print("  ✅ [Test 4] AgentFactory adds spawn_agent")
 
     # Test 5: Execution
-    print("\n[Test 5] Sub-agent execution...")
-
     async def test_execution():
         responses = [
             LLMResponse(content="Task completed.", tool_calls=None)
@@ -690,9 +1137,19 @@ def run_quick_test():
         result = await tool.execute(task="Analyze code", role="reviewer")
         assert result.success is True
         assert "Sub-Agent Execution Result" in result.content
-        print("  ✅ Sub-agent execution works")
+        print("  ✅ [Test 5] Sub-agent execution works")
+
+    # The async checks are independent, so they share one event loop and run concurrently;
+    # the task group cancels the remaining checks as soon as one fails
+    print("\n[Tests 2, 4, 5] Depth limit, AgentFactory integration, sub-agent execution...")
+
+    async def run_async_tests():
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(test_depth())
+            tg.create_task(test_factory())
+            tg.create_task(test_execution())
 
-    asyncio.run(test_execution())
+    asyncio.run(run_async_tests())
 
     print("\n" + "=" * 60)
     print("All tests passed!")
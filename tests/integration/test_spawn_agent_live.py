@@ -6,13 +6,27 @@ Requires:
 - LLM_API_KEY set in environment or .env file
 """
 
+import ast
 import asyncio
+import itertools
+import operator
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+try:
+    import pytest
+except ImportError:
+    class pytest:
+        class mark:
+            @staticmethod
+            def skipif(condition, reason=""):
+                return lambda func: func
+
 from fastapi_agent.core.agent import Agent
 from fastapi_agent.core.config import settings
 from fastapi_agent.core.llm_client import LLMClient
@@ -22,68 +36,106 @@ from fastapi_agent.tools.spawn_agent_tool import SpawnAgentTool
 from fastapi_agent.tools.file_tools import ReadTool
 from fastapi_agent.api.deps import AgentFactory
 
+# Evaluated once at collection; main() checks the key itself before running anything
+requires_llm = pytest.mark.skipif(not settings.LLM_API_KEY, reason="LLM_API_KEY not set")
+
+# Tests run concurrently; each group of tests gets its own workspace directory
+_WORKSPACE_ROOT = Path("/tmp/spawn_test")
+
+# 123 + 456, also accepted when the model formats it as a float (579.0)
+_BASIC_SPAWN_ANSWER_RE = re.compile(r"\b579(?:\.0+)?\b")
+
+
+@lru_cache(maxsize=1)
+def _get_llm_client() -> LLMClient:
+    """LLM client shared by all live tests and their sub-agents."""
+    return LLMClient(
+        api_key=settings.LLM_API_KEY,
+        api_base=settings.LLM_API_BASE,
+        model=settings.LLM_MODEL,
+    )
+
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def _eval_node(node: ast.AST):
+    """Evaluate an arithmetic expression node; anything else is rejected."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        return _BIN_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+@lru_cache(maxsize=256)
+def _evaluate(expression: str):
+    """Evaluate an arithmetic expression without eval(); repeated expressions are cached."""
+    return _eval_node(ast.parse(expression, mode="eval").body)
+
 
 class SimpleMathTool(Tool):
     """Simple math tool for testing."""
 
-    @property
-    def name(self) -> str:
-        return "calculate"
-
-    @property
-    def description(self) -> str:
-        return "Perform simple math calculations"
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "expression": {
-                    "type": "string",
-                    "description": "Math expression to evaluate (e.g., '2 + 2')"
-                }
-            },
-            "required": ["expression"]
-        }
+    # Class attributes shadow Tool's properties; the schema dict is built once
+    name = "calculate"
+    description = "Perform simple math calculations"
+    parameters = {
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Math expression to evaluate (e.g., '2 + 2')"
+            }
+        },
+        "required": ["expression"]
+    }
 
     async def execute(self, expression: str, **kwargs) -> ToolResult:
         try:
-            result = eval(expression, {"__builtins__": {}}, {})
+            result = _evaluate(expression)
             return ToolResult(success=True, content=f"Result: {result}")
         except Exception as e:
             return ToolResult(success=False, error=str(e))
 
 
-async def test_basic_spawn():
-    """Test basic spawn functionality with real LLM."""
-    print("\n" + "=" * 60)
-    print("Test: Basic Spawn Agent")
-    print("=" * 60)
-
-    if not settings.LLM_API_KEY:
-        print("  ⚠️  Skipped: LLM_API_KEY not set")
-        return False
-
-    llm_client = LLMClient(
-        api_key=settings.LLM_API_KEY,
-        api_base=settings.LLM_API_BASE,
-        model=settings.LLM_MODEL,
-    )
-
-    tools = [SimpleMathTool()]
-    parent_tools = {t.name: t for t in tools}
-
+@lru_cache(maxsize=1)
+def _get_spawn_env() -> tuple[SimpleMathTool, SpawnAgentTool]:
+    """Math tool and spawn_agent tool shared by the two spawn tests."""
+    math_tool = SimpleMathTool()
     spawn_tool = SpawnAgentTool(
-        llm_client=llm_client,
-        parent_tools=parent_tools,
-        workspace_dir="/tmp/spawn_test",
+        llm_client=_get_llm_client(),
+        parent_tools={math_tool.name: math_tool},
+        workspace_dir=str(_WORKSPACE_ROOT / "spawn"),
         current_depth=0,
         max_depth=2,
         default_max_steps=5,
     )
+    return math_tool, spawn_tool
+
+
+@requires_llm
+async def test_basic_spawn(out: list[str] | None = None):
+    """Test basic spawn functionality with real LLM."""
+    say = print if out is None else out.append
+    say("\n" + "=" * 60)
+    say("Test: Basic Spawn Agent")
+    say("=" * 60)
+
+    _, spawn_tool = _get_spawn_env()
 
-    print("  Spawning sub-agent to calculate 123 + 456...")
+    say("  Spawning sub-agent to calculate 123 + 456...")
 
     result = await spawn_tool.execute(
         task="Calculate 123 + 456 using the calculate tool and tell me the result.",
@@ -92,48 +144,32 @@ async def test_basic_spawn():
         max_steps=5
     )
 
-    print(f"  Success: {result.success}")
+    say(f"  Success: {result.success}")
     if result.success:
-        print(f"  Result preview: {result.content[:200]}...")
-        if "579" in result.content:
-            print("  ✅ Correct answer found in result!")
+        say(f"  Result preview: {result.content[:200]}...")
+        if _BASIC_SPAWN_ANSWER_RE.search(result.content):
+            say("  ✅ Correct answer found in result!")
             return True
         else:
-            print("  ⚠️  Answer not found, but execution succeeded")
+            say("  ⚠️  Answer not found, but execution succeeded")
             return True
     else:
-        print(f"  Error: {result.error}")
+        say(f"  Error: {result.error}")
         return False
 
 
-async def test_agent_with_spawn_tool():
+@requires_llm
+async def test_agent_with_spawn_tool(out: list[str] | None = None):
     """Test Agent using spawn_agent tool."""
-    print("\n" + "=" * 60)
-    print("Test: Agent with Spawn Tool")
-    print("=" * 60)
+    say = print if out is None else out.append
+    say("\n" + "=" * 60)
+    say("Test: Agent with Spawn Tool")
+    say("=" * 60)
 
-    if not settings.LLM_API_KEY:
-        print("  ⚠️  Skipped: LLM_API_KEY not set")
-        return False
+    llm_client = _get_llm_client()
 
-    llm_client = LLMClient(
-        api_key=settings.LLM_API_KEY,
-        api_base=settings.LLM_API_BASE,
-        model=settings.LLM_MODEL,
-    )
-
-    # Create tools including spawn_agent
-    math_tool = SimpleMathTool()
-    parent_tools = {"calculate": math_tool}
-
-    spawn_tool = SpawnAgentTool(
-        llm_client=llm_client,
-        parent_tools=parent_tools,
-        workspace_dir="/tmp/spawn_test",
-        current_depth=0,
-        max_depth=2,
-        default_max_steps=5,
-    )
+    # Tools including spawn_agent
+    math_tool, spawn_tool = _get_spawn_env()
 
     agent = Agent(
         llm_client=llm_client,
@@ -142,45 +178,50 @@ When asked to do calculations, you should spawn a sub-agent with role "calculato
 Use the spawn_agent tool with task describing what calculation to do.""",
         tools=[math_tool, spawn_tool],
         max_steps=10,
-        workspace_dir="/tmp/spawn_test",
+        workspace_dir=spawn_tool._workspace_dir,
         enable_logging=True,
     )
 
-    print("  Asking agent to coordinate a calculation task...")
+    say("  Asking agent to coordinate a calculation task...")
     agent.add_user_message("Please spawn a sub-agent to calculate 100 * 5 + 50")
 
-    result, logs = await agent.run()
+    # Spawning is all this test checks for, so stop once a spawn_agent call is made
+    result, logs = await agent.run(
+        stop_condition=lambda log: log.get("type") == "tool_call" and log.get("tool") == "spawn_agent"
+    )
 
-    print(f"  Steps taken: {len([l for l in logs if l.get('type') == 'step'])}")
+    # Count steps and collect spawn calls in a single pass
+    steps = 0
+    spawn_calls = []
+    for log in logs:
+        log_type = log.get("type")
+        if log_type == "step":
+            steps += 1
+        elif log_type == "tool_call" and log.get("tool") == "spawn_agent":
+            spawn_calls.append(log)
 
-    spawn_calls = [l for l in logs if l.get('type') == 'tool_call' and l.get('tool') == 'spawn_agent']
-    print(f"  Spawn agent calls: {len(spawn_calls)}")
+    say(f"  Steps taken: {steps}")
+    say(f"  Spawn agent calls: {len(spawn_calls)}")
 
-    print(f"  Result preview: {result[:300]}...")
+    say(f"  Result preview: {result[:300]}...")
 
     if spawn_calls:
-        print("  ✅ Agent correctly used spawn_agent!")
+        say("  ✅ Agent correctly used spawn_agent!")
         return True
     else:
-        print("  ⚠️  Agent did not use spawn_agent (might have solved directly)")
+        say("  ⚠️  Agent did not use spawn_agent (might have solved directly)")
         return True
 
 
-async def test_factory_integration():
+@requires_llm
+async def test_factory_integration(out: list[str] | None = None):
     """Test AgentFactory creates agent with spawn_agent."""
-    print("\n" + "=" * 60)
-    print("Test: AgentFactory Integration")
-    print("=" * 60)
-
-    if not settings.LLM_API_KEY:
-        print("  ⚠️  Skipped: LLM_API_KEY not set")
-        return False
+    say = print if out is None else out.append
+    say("\n" + "=" * 60)
+    say("Test: AgentFactory Integration")
+    say("=" * 60)
 
-    llm_client = LLMClient(
-        api_key=settings.LLM_API_KEY,
-        api_base=settings.LLM_API_BASE,
-        model=settings.LLM_MODEL,
-    )
+    llm_client = _get_llm_client()
 
     factory = AgentFactory(settings)
 
@@ -196,53 +237,47 @@ async def test_factory_integration():
 
     agent = await factory.create_agent(llm_client, config)
 
-    print(f"  Agent tools: {list(agent.tools.keys())}")
+    say(f"  Agent tools: {list(agent.tools.keys())}")
 
     if "spawn_agent" in agent.tools:
         spawn_tool = agent.tools["spawn_agent"]
-        print(f"  spawn_agent max_depth: {spawn_tool._max_depth}")
-        print(f"  spawn_agent current_depth: {spawn_tool._current_depth}")
-        print("  ✅ AgentFactory correctly configured spawn_agent!")
+        say(f"  spawn_agent max_depth: {spawn_tool._max_depth}")
+        say(f"  spawn_agent current_depth: {spawn_tool._current_depth}")
+        say("  ✅ AgentFactory correctly configured spawn_agent!")
         return True
     else:
-        print("  ❌ spawn_agent not found in agent tools")
+        say("  ❌ spawn_agent not found in agent tools")
         return False
 
 
-async def test_depth_limit_live():
+@requires_llm
+async def test_depth_limit_live(out: list[str] | None = None):
     """Test depth limit with real execution."""
-    print("\n" + "=" * 60)
-    print("Test: Depth Limit (Live)")
-    print("=" * 60)
+    say = print if out is None else out.append
+    say("\n" + "=" * 60)
+    say("Test: Depth Limit (Live)")
+    say("=" * 60)
 
-    if not settings.LLM_API_KEY:
-        print("  ⚠️  Skipped: LLM_API_KEY not set")
-        return False
-
-    llm_client = LLMClient(
-        api_key=settings.LLM_API_KEY,
-        api_base=settings.LLM_API_BASE,
-        model=settings.LLM_MODEL,
-    )
+    llm_client = _get_llm_client()
 
     # Create spawn_agent at depth 2 with max_depth 2
     spawn_tool = SpawnAgentTool(
         llm_client=llm_client,
         parent_tools={},
-        workspace_dir="/tmp/spawn_test",
+        workspace_dir=str(_WORKSPACE_ROOT / "depth_limit"),
         current_depth=2,
         max_depth=2,
     )
 
-    print("  Attempting to spawn at max depth...")
+    say("  Attempting to spawn at max depth...")
     result = await spawn_tool.execute(task="This should fail")
 
     if not result.success and "Maximum" in result.error:
-        print(f"  Error: {result.error}")
-        print("  ✅ Depth limit correctly enforced!")
+        say(f"  Error: {result.error}")
+        say("  ✅ Depth limit correctly enforced!")
         return True
     else:
-        print("  ❌ Depth limit not enforced")
+        say("  ❌ Depth limit not enforced")
         return False
 
 
@@ -255,13 +290,31 @@ async def main():
     print(f"API Base: {settings.LLM_API_BASE}")
     print(f"API Key: {'***' + settings.LLM_API_KEY[-4:] if settings.LLM_API_KEY else 'NOT SET'}")
 
-    results = []
+    if not settings.LLM_API_KEY:
+        print("\n⚠️  All tests skipped: LLM_API_KEY not set")
+        return True
+
+    # The tests are independent and bound by LLM round trips, so they run concurrently.
+    # Each test writes its output to its own buffer, flushed in order once all are done.
+    tests = [
+        ("Depth Limit", test_depth_limit_live),
+        ("Factory Integration", test_factory_integration),
+        ("Basic Spawn", test_basic_spawn),
+        ("Agent with Spawn", test_agent_with_spawn_tool),
+    ]
+    outputs = [[] for _ in tests]
+    outcomes = await asyncio.gather(
+        *(test(out) for (_, test), out in zip(tests, outputs, strict=True)),
+        return_exceptions=True,
+    )
 
-    # Run tests
-    results.append(("Depth Limit", await test_depth_limit_live()))
-    results.append(("Factory Integration", await test_factory_integration()))
-    results.append(("Basic Spawn", await test_basic_spawn()))
-    results.append(("Agent with Spawn", await test_agent_with_spawn_tool()))
+    results = []
+    for (name, _), out, outcome in zip(tests, outputs, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            out.append(f"  ❌ {name} raised {type(outcome).__name__}: {outcome}")
+            outcome = False
+        results.append((name, outcome))
+    sys.stdout.write("\n".join(itertools.chain.from_iterable(outputs)) + "\n")
 
     # Summary
     print("\n" + "=" * 60)
@@ -284,5 +337,13 @@ async def main():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    # uvloop ships with uvicorn[standard]; fall back to the default loop without it
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        success = runner.run(main())
     sys.exit(0 if success else 1)
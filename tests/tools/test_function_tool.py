@@ -0,0 +1,39 @@
+"""Tests for FunctionTool schema generation."""
+
+from typing import List, Optional, Union
+
+import pytest
+
+from fastapi_agent.tools.function_tool import _generate_json_schema, _type_to_json_schema
+
+
+@pytest.mark.parametrize(
+    "python_type,expected",
+    [
+        (str, {"type": "string"}),
+        (int, {"type": "integer"}),
+        (Optional[int], {"type": "integer"}),
+        (int | None, {"type": "integer"}),
+        (Union[None, bool], {"type": "boolean"}),
+        (List[str], {"type": "array", "items": {"type": "string"}}),
+        (list[int], {"type": "array", "items": {"type": "integer"}}),
+        (Optional[list[float]], {"type": "array", "items": {"type": "number"}}),
+        (Union[int, str], {"type": "string"}),
+    ],
+)
+def test_type_to_json_schema(python_type, expected):
+    """Test Python type to JSON Schema conversion."""
+    assert _type_to_json_schema(python_type) == expected
+
+
+def test_generate_json_schema_resolves_string_annotations():
+    """Test that forward-referenced (string) annotations are still resolved."""
+
+    def search(query: "str", limit: "Optional[int]" = None) -> "str":
+        return query
+
+    schema = _generate_json_schema(search)
+
+    assert schema["properties"]["query"]["type"] == "string"
+    assert schema["properties"]["limit"]["type"] == "integer"
+    assert schema["required"] == ["query"]
@@ -1,9 +1,19 @@
 """Tests for Session Note Tool."""
 
+import asyncio
 import json
+from collections import OrderedDict
+import orjson
 import pytest
 from pathlib import Path
-from fastapi_agent.tools.note_tool import SessionNoteTool, RecallNoteTool
+from fastapi_agent.tools import note_tool
+from fastapi_agent.tools.note_tool import NoteWriteBatcher, SessionNoteTool, RecallNoteTool
+
+
+def _load_notes(path):
+    """Read a JSON Lines notes file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
 
 
 @pytest.fixture
@@ -41,8 +51,7 @@ async def test_record_note_creates_file(session_tool, temp_memory_file):
     assert Path(temp_memory_file).exists()
 
     # Check file content
-    with open(temp_memory_file, 'r', encoding='utf-8') as f:
-        notes = json.load(f)
+    notes = _load_notes(temp_memory_file)
 
     assert len(notes) == 1
     assert notes[0]["content"] == "用户偏好简洁的回复"
@@ -66,8 +75,7 @@ async def test_record_multiple_notes(session_tool, temp_memory_file):
     )
 
     # Check file content
-    with open(temp_memory_file, 'r', encoding='utf-8') as f:
-        notes = json.load(f)
+    notes = _load_notes(temp_memory_file)
 
     assert len(notes) == 2
     assert notes[0]["content"] == "项目使用 Python 3.12"
@@ -157,7 +165,173 @@ async def test_default_category(session_tool):
 
     # Read from file
     memory_file = session_tool.memory_file
-    with open(memory_file, 'r', encoding='utf-8') as f:
-        notes = json.load(f)
+    notes = _load_notes(memory_file)
 
     assert notes[0]["category"] == "general"
+
+
+@pytest.mark.asyncio
+async def test_record_note_loads_file_once(session_tool, temp_memory_file, monkeypatch):
+    """Test that the notes file is only parsed on the first record."""
+    load_calls = []
+    original_load = session_tool._load_from_file
+
+    def counting_load():
+        load_calls.append(1)
+        return original_load()
+
+    monkeypatch.setattr(session_tool, "_load_from_file", counting_load)
+
+    await session_tool.execute(content="第一条", category="general")
+    await session_tool.execute(content="第二条", category="general")
+    await session_tool.execute(content="第三条", category="general")
+
+    assert len(load_calls) == 1
+
+    notes = _load_notes(temp_memory_file)
+
+    assert [n["content"] for n in notes] == ["第一条", "第二条", "第三条"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_records(session_tool, temp_memory_file, monkeypatch):
+    """Test that concurrent records are written to the file in one batch."""
+    save_calls = []
+    original_append = session_tool._append_to_file
+
+    def counting_append(notes):
+        save_calls.append(len(notes))
+        original_append(notes)
+
+    monkeypatch.setattr(session_tool, "_append_to_file", counting_append)
+
+    batcher = NoteWriteBatcher(max_queue_time=0.05)
+    monkeypatch.setattr("fastapi_agent.tools.note_tool.note_batcher", batcher)
+    batcher.start()
+    try:
+        results = await asyncio.gather(*(
+            session_tool.execute(content=f"笔记 {i}") for i in range(5)
+        ))
+    finally:
+        await batcher.stop()
+
+    assert all(r.success for r in results)
+    assert save_calls == [5]
+
+    notes = _load_notes(temp_memory_file)
+
+    assert len(notes) == 5
+
+
+@pytest.mark.asyncio
+async def test_recall_reuses_parsed_notes(session_tool, recall_tool, temp_memory_file, monkeypatch):
+    """Test that recall only re-parses the notes file after it changes."""
+    await session_tool.execute(content="第一条", category="general")
+
+    parse_calls = []
+    original_loads = orjson.loads
+
+    def counting_loads(data):
+        parse_calls.append(1)
+        return original_loads(data)
+
+    monkeypatch.setattr("fastapi_agent.tools.note_tool.orjson.loads", counting_loads)
+
+    await recall_tool.execute()
+    await recall_tool.execute(category="general")
+    assert parse_calls == []
+
+    # An external write to the file invalidates the cached notes
+    Path(temp_memory_file).write_text(
+        json.dumps([{"category": "general", "content": "外部写入", "timestamp": "t"}]),
+        encoding="utf-8",
+    )
+    result = await recall_tool.execute()
+
+    assert parse_calls == [1]
+    assert "外部写入" in result.content
+
+
+@pytest.mark.asyncio
+async def test_record_appends_one_line_per_note(session_tool, temp_memory_file):
+    """Test that records append to the file instead of rewriting it."""
+    await session_tool.execute(content="第一条", category="general")
+    first_line = Path(temp_memory_file).read_bytes()
+
+    await session_tool.execute(content="第二条", category="general")
+    data = Path(temp_memory_file).read_bytes()
+
+    assert data.startswith(first_line)
+    assert data.count(b"\n") == 2
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_array_file_is_migrated(session_tool, recall_tool, temp_memory_file):
+    """Test that a notes file in the old JSON array format is still read and then migrated."""
+    legacy = [{"timestamp": "t", "category": "general", "content": "旧笔记"}]
+    Path(temp_memory_file).write_text(json.dumps(legacy, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    assert "旧笔记" in (await recall_tool.execute()).content
+
+    await session_tool.execute(content="新笔记", category="general")
+
+    assert [n["content"] for n in _load_notes(temp_memory_file)] == ["旧笔记", "新笔记"]
+    assert "新笔记" in (await recall_tool.execute()).content
+
+
+@pytest.mark.asyncio
+async def test_two_writers_on_one_file(temp_memory_file, recall_tool):
+    """Test that notes from another tool instance on the same file are not hidden."""
+    tool_a = SessionNoteTool(memory_file=temp_memory_file)
+    tool_b = SessionNoteTool(memory_file=temp_memory_file)
+
+    await tool_a.execute(content="A1")
+    await tool_b.execute(content="B1")
+    await tool_a.execute(content="A2")
+
+    assert [n["content"] for n in _load_notes(temp_memory_file)] == ["A1", "B1", "A2"]
+    result = await recall_tool.execute()
+    assert "A1" in result.content
+    assert "B1" in result.content
+    assert "A2" in result.content
+
+
+@pytest.mark.asyncio
+async def test_record_extends_cached_snapshot(session_tool, recall_tool, temp_memory_file, monkeypatch):
+    """Test that a record extends the shared snapshot and its category index in place."""
+    await session_tool.execute(content="第一条", category="decision")
+    await recall_tool.execute(category="decision")
+    snapshot = session_tool._snapshot
+
+    parse_calls = []
+    original_loads = orjson.loads
+
+    def counting_loads(data):
+        parse_calls.append(1)
+        return original_loads(data)
+
+    monkeypatch.setattr("fastapi_agent.tools.note_tool.orjson.loads", counting_loads)
+
+    await session_tool.execute(content="第二条", category="decision")
+    result = await recall_tool.execute(category="decision")
+
+    assert parse_calls == []
+    assert session_tool._snapshot is snapshot
+    assert "第一条" in result.content
+    assert "第二条" in result.content
+
+
+@pytest.mark.asyncio
+async def test_notes_cache_is_bounded(tmp_path, monkeypatch):
+    """Test that the process-wide notes cache evicts the least recently used file."""
+    monkeypatch.setattr(note_tool, "_NOTES_CACHE_SIZE", 2)
+    monkeypatch.setattr(note_tool, "_notes_cache", OrderedDict())
+    paths = [str(tmp_path / f"notes_{i}.json") for i in range(3)]
+
+    for path in paths:
+        await SessionNoteTool(memory_file=path).execute(content=path)
+
+    assert list(note_tool._notes_cache) == paths[1:]
+    # Evicted files are simply parsed again on the next recall
+    assert paths[0] in (await RecallNoteTool(memory_file=paths[0]).execute()).content
+    assert list(note_tool._notes_cache) == [paths[2], paths[0]]